@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""BLOB throughput of TCP client transport for different read size settings.
+
+Serves a stream of large `setBLOBVector` messages over loopback
+and measures how fast `indi.transport.client.TCP` receives and parses them.
+
+Usage (from repository root): PYTHONPATH=. python benchmarks/blob_throughput.py [blob size in MiB] [number of blobs]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+from indi import message
+from indi.device import values
+from indi.message import const, one_parts
+from indi.transport.client import TCP
+
+SETTINGS = (
+    dict(read_size=1024),
+    dict(read_size=65536),
+    dict(read_size=1048576),
+    dict(read_size=1024, adaptive_read=True),
+)
+
+
+def blob_message(size: int) -> bytes:
+    blob = values.BLOB(os.urandom(size), ".fits")
+    return message.SetBLOBVector(
+        device="CAMERA",
+        name="CCD1",
+        state=const.State.OK,
+        children=[
+            one_parts.OneBLOB(
+                name="CCD1", value=blob.binary_base64, size=blob.size, format=".fits"
+            )
+        ],
+    ).to_string()
+
+
+async def measure(data: bytes, count: int, settings: dict) -> float:
+    async def serve(reader, writer):
+        for _ in range(count):
+            writer.write(data)
+            await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(serve, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    received = []
+    start = time.perf_counter()
+    async with server:
+        handler = await TCP("127.0.0.1", port, **settings).connect(
+            received.append, for_blobs=True
+        )
+        await handler.wait_for_messages()
+        handler.close()
+    elapsed = time.perf_counter() - start
+
+    assert len(received) == count
+    return elapsed
+
+
+async def main(size_mib: float, count: int):
+    data = blob_message(int(size_mib * 1024 * 1024))
+    print(f"{count} x setBLOBVector of {len(data) / 1024 / 1024:.1f} MiB on wire")
+
+    for settings in SETTINGS:
+        elapsed = await measure(data, count, settings)
+        throughput = len(data) * count / elapsed / 1024 / 1024
+        print(f"{settings}: {elapsed:.2f} s, {throughput:.1f} MiB/s")
+
+
+if __name__ == "__main__":
+    size_mib = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    asyncio.run(main(size_mib, count))
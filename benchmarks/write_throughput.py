@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Message send rate of TCP server and client transports.
+
+Sends a burst of small `setNumberVector` messages over loopback
+and measures how many messages per second reach the other side.
+Per-message write and drain (how transports used to send) is compared
+with batched writes, with and without a flush window.
+
+Usage (from repository root): PYTHONPATH=. python benchmarks/write_throughput.py [number of messages]
+"""
+
+import asyncio
+import sys
+import time
+
+from indi import message
+from indi.message import const, one_parts
+from indi.transport.client.tcp import ConnectionHandler as ClientConnectionHandler
+from indi.transport.queue import OutboundQueue
+from indi.transport.server.tcp import ConnectionHandler as ServerConnectionHandler
+
+SETTINGS = (
+    dict(batched=False),
+    dict(batched=True, flush_window=0),
+    dict(batched=True, flush_window=0.001),
+)
+
+
+def number_message(value: int) -> message.IndiMessage:
+    return message.SetNumberVector(
+        device="FOCUSER",
+        name="POSITION",
+        state=const.State.BUSY,
+        children=[one_parts.OneNumber(name="VALUE", value=value)],
+    )
+
+
+class PerMessageClientHandler(ClientConnectionHandler):
+    """Sends every message with its own write and drain."""
+
+    def send_message(self, msg: message.IndiMessage):
+        asyncio.get_running_loop().create_task(self.send_locked(msg.to_string()))
+
+    async def send_locked(self, data: bytes):
+        async with self.lock:
+            await self.send(data)
+
+
+class PerMessageServerHandler(ServerConnectionHandler):
+    """Sends every message with its own write and drain."""
+
+    def data_from_device(self, msg: message.IndiMessage, data: bytes):
+        asyncio.get_running_loop().create_task(self.send_locked(data))
+
+    async def send_locked(self, data: bytes):
+        async with self.lock:
+            await self.send(data)
+
+
+async def receive_all(reader: asyncio.StreamReader, expected: int, done):
+    received = 0
+    while received < expected:
+        chunk = await reader.read(65536)
+        if not chunk:
+            break
+        received += len(chunk)
+    done.set_result(received)
+
+
+async def measure(side: str, messages: list, settings: dict) -> float:
+    expected = sum(len(msg.to_string()) for msg in messages)
+    done = asyncio.get_running_loop().create_future()
+
+    async def serve(reader, writer):
+        await receive_all(reader, expected, done)
+        writer.close()
+
+    server = await asyncio.start_server(serve, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    async with server:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        flush_window = settings.get("flush_window", 0)
+
+        start = time.perf_counter()
+        if side == "client":
+            if settings["batched"]:
+                client = ClientConnectionHandler(
+                    reader, writer, print, flush_window=flush_window
+                )
+            else:
+                client = PerMessageClientHandler(reader, writer, print)
+                client.lock = asyncio.Lock()
+            for msg in messages:
+                client.send_message(msg)
+            connection = client
+        else:
+            queue = OutboundQueue(len(messages))
+            if settings["batched"]:
+                handler = ServerConnectionHandler(
+                    reader, writer, None, queue=queue, flush_window=flush_window
+                )
+            else:
+                handler = PerMessageServerHandler(reader, writer, None)
+                handler.lock = asyncio.Lock()
+            for msg in messages:
+                handler.data_from_device(msg, msg.to_string())
+            connection = handler
+
+        assert await done == expected
+        elapsed = time.perf_counter() - start
+        connection.close()
+
+    return elapsed
+
+
+async def main(count: int):
+    messages = [number_message(i) for i in range(count)]
+    print(f"{count} x setNumberVector")
+
+    for side in ("client", "server"):
+        for settings in SETTINGS:
+            elapsed = await measure(side, messages, settings)
+            print(f"{side} {settings}: {elapsed:.3f} s, {count / elapsed:.0f} msg/s")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    asyncio.run(main(count))
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
 import uuid
-from typing import Any, Callable, Dict, Iterable, List, Optional, Type
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
 
 import indi
 from indi import message
@@ -23,6 +24,7 @@ class _CallbackConfig:
         event_type: Type[events.BaseEvent],
         callback: Callable,
         uuid: uuid.UUID,
+        seq: int = 0,
     ):
         self.device = device
         self.vector = vector
@@ -30,6 +32,11 @@ class _CallbackConfig:
         self.event_type = event_type
         self.callback = callback
         self.uuid = uuid
+        self.seq = seq
+
+    @property
+    def key(self) -> _CallbackKey:
+        return self.device, self.vector, self.element, self.event_type
 
     def accepts_event(self, event: events.BaseEvent) -> bool:
         """Checks if event should be processed by callbacked associated with this configuration.
@@ -59,6 +66,77 @@ class _CallbackConfig:
         )
 
 
+_CallbackKey = Tuple[
+    Optional[str], Optional[str], Optional[str], Type[events.BaseEvent]
+]
+
+
+class _CallbackIndex:
+    """Callback configurations indexed by device, vector, element and event type.
+
+    Every configuration is kept in exactly one bucket, `None` being a wildcard,
+    so finding callbacks of an event takes a constant number of lookups
+    regardless of the number of registered callbacks.
+    Matching callbacks are returned in registration order.
+    """
+
+    def __init__(self) -> None:
+        self.by_uuid: Dict[uuid.UUID, _CallbackConfig] = {}
+        self.buckets: Dict[_CallbackKey, Dict[uuid.UUID, _CallbackConfig]] = {}
+        self._seq = itertools.count()
+        self._event_types: Dict[type, Tuple[Type[events.BaseEvent], ...]] = {}
+
+    def __iter__(self):
+        return iter(list(self.by_uuid.values()))
+
+    def __len__(self) -> int:
+        return len(self.by_uuid)
+
+    def add(self, config: _CallbackConfig):
+        config.seq = next(self._seq)
+        self.by_uuid[config.uuid] = config
+        self.buckets.setdefault(config.key, {})[config.uuid] = config
+
+    def remove(self, config: _CallbackConfig):
+        if self.by_uuid.pop(config.uuid, None) is None:
+            return
+        bucket = self.buckets[config.key]
+        del bucket[config.uuid]
+        if not bucket:
+            del self.buckets[config.key]
+
+    def _matching_event_types(self, event_class: type):
+        event_types = self._event_types.get(event_class)
+        if event_types is None:
+            event_types = tuple(
+                klass
+                for klass in event_class.__mro__
+                if issubclass(klass, events.BaseEvent)
+            )
+            self._event_types[event_class] = event_types
+        return event_types
+
+    def matching(self, event: events.BaseEvent) -> List[_CallbackConfig]:
+        if not self.buckets:
+            return []
+
+        devices = {None, event.device.name if event.device else None}
+        vectors = {None, event.vector.name if event.vector else None}
+        elements = {None, event.element.name if event.element else None}
+
+        found: List[_CallbackConfig] = []
+        for event_type in self._matching_event_types(event.__class__):
+            for device in devices:
+                for vector in vectors:
+                    for element in elements:
+                        bucket = self.buckets.get((device, vector, element, event_type))
+                        if bucket:
+                            found.extend(bucket.values())
+
+        found.sort(key=lambda config: config.seq)
+        return found
+
+
 class _EventWaitResult:
     def __init__(self) -> None:
         self.event: Optional[events.BaseEvent] = None
@@ -69,7 +147,8 @@ class BaseClient:
     def __init__(self) -> None:
         """Constructor for INDI client."""
         self.devices: Dict[str, Device] = {}
-        self.callbacks: List[_CallbackConfig] = []
+        self.callbacks = _CallbackIndex()
+        self._refresh_scheduled = False
 
     def __getitem__(self, key) -> Device:
         return self.devices[key]
@@ -151,7 +230,7 @@ class BaseClient:
             uuid=uid,
         )
 
-        self.callbacks.append(callback_config)
+        self.callbacks.add(callback_config)
         return uid
 
     def rmonevent(
@@ -163,8 +242,14 @@ class BaseClient:
         event_type: Optional[Type[events.BaseEvent]] = None,
         callback: Optional[Callable] = None,
     ):
+        if uuid is not None:
+            cb = self.callbacks.by_uuid.get(uuid)
+            candidates = [cb] if cb else []
+        else:
+            candidates = list(self.callbacks)
+
         to_rm = list()
-        for cb in self.callbacks:
+        for cb in candidates:
             if (
                 uuid
                 in (
@@ -198,6 +283,51 @@ class BaseClient:
         for cb in to_rm:
             self.callbacks.remove(cb)
 
+    def _cached_events(
+        self,
+        device: Optional[str],
+        vector: Optional[str],
+        element: Optional[str],
+        event_type: Type[events.BaseEvent],
+    ) -> List[events.BaseEvent]:
+        """Events describing current (cached) state of matching vectors and elements."""
+        result: List[events.BaseEvent] = []
+        for dev in self.devices.values():
+            if device is not None and dev.name != device:
+                continue
+            for vec in dev.vectors.values():
+                if vector is not None and vec.name != vector:
+                    continue
+                if element is None:
+                    result.append(events.StateUpdate(vec, vec.state, vec.state))
+                for el in vec.elements.values():
+                    if element is not None and el.name != element:
+                        continue
+                    result.append(events.ValueUpdate(el, el.value, el.value))
+        return [event for event in result if isinstance(event, event_type)]
+
+    def refresh(self):
+        """Asks server for all definitions.
+
+        Requests made in the same loop iteration are sent as one message.
+        """
+        if self._refresh_scheduled:
+            return
+        self._refresh_scheduled = True
+
+        def send_refresh():
+            self._refresh_scheduled = False
+            self.handshake()
+
+        asyncio.get_running_loop().call_soon(send_refresh)
+
+    def connection_reset(self):
+        """Called when connection to the server is (re-)established.
+
+        Cached state may be outdated, so definitions are requested again.
+        """
+        self.refresh()
+
     async def waitforevent(
         self,
         device: Optional[str] = None,
@@ -211,7 +341,16 @@ class BaseClient:
         polling_enabled: bool = True,
         polling_delay: float = 1.0,
         polling_interval: float = 1.0,
+        push: bool = False,
     ):
+        """Waits for an event satisfying condition.
+
+        By default current state is periodically requested with `getProperties`
+        (polling) until the condition is met.
+        In `push` mode cached state of the client is checked first,
+        returning event describing it if it already satisfies the condition,
+        and then only events pushed by the server are awaited.
+        """
         assert 1 == sum(
             1
             for _ in filter(
@@ -227,34 +366,41 @@ class BaseClient:
         lock = asyncio.Event()
         result = _EventWaitResult()
 
-        def cb(event: events.BaseEvent):
-            release = False
-
+        def releases(event: events.BaseEvent) -> bool:
             if check is not None:
                 if check(event):
-                    release = True
+                    return True
 
             if expect is not None:
                 if isinstance(event, events.ValueUpdate):
                     if event.new_value == expect:
-                        release = True
+                        return True
                 if isinstance(event, events.StateUpdate):
                     if event.new_state == expect:
-                        release = True
+                        return True
 
             if initial is not None:
                 if isinstance(event, events.ValueUpdate):
                     if event.new_value != initial:
-                        release = True
+                        return True
                 if isinstance(event, events.StateUpdate):
                     if event.new_state != initial:
-                        release = True
+                        return True
+
+            return False
 
-            if release:
+        def cb(event: events.BaseEvent):
+            if not lock.is_set() and releases(event):
                 result.event = event
                 lock.set()
 
-        if polling_enabled:
+        if push:
+            for event in self._cached_events(device, vector, element, event_type):
+                if releases(event):
+                    return event
+
+        poll_task = None
+        if polling_enabled and not push:
 
             async def poll():
                 kwargs = {}
@@ -270,13 +416,7 @@ class BaseClient:
                     self.send_message(msg)
                     await asyncio.sleep(polling_interval)
 
-            asyncio.get_running_loop().create_task(poll())
-
-        async def timeout_check():
-            await asyncio.sleep(timeout)
-            if not lock.is_set():
-                result.timeout = True
-                lock.set()
+            poll_task = asyncio.get_running_loop().create_task(poll())
 
         uid = self.onevent(
             device=device,
@@ -286,12 +426,17 @@ class BaseClient:
             callback=cb,
         )
 
-        if timeout is not None and timeout > 0:
-            asyncio.get_running_loop().create_task(timeout_check())
-
-        await lock.wait()
-
-        self.rmonevent(uuid=uid)
+        try:
+            if timeout is not None and timeout > 0:
+                await asyncio.wait_for(lock.wait(), timeout)
+            else:
+                await lock.wait()
+        except asyncio.TimeoutError:
+            result.timeout = True
+        finally:
+            self.rmonevent(uuid=uid)
+            if poll_task is not None:
+                poll_task.cancel()
 
         if result.timeout:
             raise Exception("Timeout occurred")
@@ -299,15 +444,14 @@ class BaseClient:
         return result.event
 
     def trigger_event(self, event: events.BaseEvent):
-        for callback in self.callbacks:
-            if callback.accepts_event(event):
-                try:
-                    if asyncio.iscoroutinefunction(callback.callback):
-                        asyncio.get_running_loop().create_task(callback.callback(event))
-                    else:
-                        callback.callback(event)
-                except:
-                    logger.exception("Error in event handler")
+        for callback in self.callbacks.matching(event):
+            try:
+                if asyncio.iscoroutinefunction(callback.callback):
+                    asyncio.get_running_loop().create_task(callback.callback(event))
+                else:
+                    callback.callback(event)
+            except:
+                logger.exception("Error in event handler")
 
     def handshake(self, device=None, name=None, version=indi.__protocol_version__):
         self.send_message(
@@ -338,8 +482,10 @@ class Client(BaseClient):
 
     def blob_handshake(self, device):
         super().blob_handshake(device)
+        shared_memory = getattr(self.blob_connection_handler, "shared_memory", False)
+        shm = "1" if shared_memory else None
         self.blob_connection_handler.send_message(
-            message.EnableBLOB(device=device, value=const.BLOBEnable.ONLY)
+            message.EnableBLOB(device=device, value=const.BLOBEnable.ONLY, shm=shm)
         )
 
     async def start(self):
@@ -361,7 +507,7 @@ class Client(BaseClient):
             self.blob_connection_handler.wait_for_messages()
         )
 
-        self.handshake()
+        self.connection_reset()
 
     def stop(self):
         self.control_connection_handler.close()
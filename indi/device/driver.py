@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Dict, Optional, Type, cast
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Type, cast
 
 from indi import message
 from indi.device.events import attach_event_handlers
@@ -9,7 +10,7 @@ from indi.device.properties import Group as GroupDefinition
 from indi.device.properties.instance.group import Group, GroupGetter
 from indi.device.properties.instance.vectors import Vector
 from indi.message import IndiMessage
-from indi.routing import Device, Router
+from indi.routing import Device, FanOut, Router
 
 if TYPE_CHECKING:
     from indi.device.snoop import SnoopingClient
@@ -32,6 +33,10 @@ class DriverMeta(type):
 class Driver(Device, metaclass=DriverMeta):
     _group_definitions: Dict[str, GroupDefinition] = {}
 
+    # answer getProperties with cached definition snapshots,
+    # disable if definitions have to reflect `Read` event handlers every time
+    cache_definitions = True
+
     def __init__(self, name: Optional[str] = None, router: Optional[Router] = None):
         attach_event_handlers(self)
 
@@ -48,6 +53,9 @@ class Driver(Device, metaclass=DriverMeta):
             for k, vector in group.vectors.items():
                 self._vectors[vector.name] = vector
 
+        self._batch_depth = 0
+        self._batch_pending: Dict[str, Vector] = {}
+
         if self._router:
             self._router.register_device(self)
         self._snooping_client: Optional[SnoopingClient] = None
@@ -88,6 +96,9 @@ class Driver(Device, metaclass=DriverMeta):
     def accepts(self, device: Optional[str]) -> bool:
         return device is None or self.name == device
 
+    def routing_name(self) -> Optional[str]:
+        return self.name
+
     def get_group(self, name: str) -> Optional[Group]:
         return self._groups.get(name)
 
@@ -95,15 +106,42 @@ class Driver(Device, metaclass=DriverMeta):
         if self._router and msg:
             self._router.process_message(msg, self)
 
+    @contextmanager
+    def batch(self) -> Iterator[Driver]:
+        """Defers set messages of all vectors until all changes are done.
+
+        Every vector changed inside the context sends one set message
+        when the outermost context exits, in order of first change.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                pending, self._batch_pending = self._batch_pending, {}
+                for vector in pending.values():
+                    self.send_message(vector.to_update_message())
+
+    def send_vector_update(self, vector: Vector):
+        if self._batch_depth > 0:
+            self._batch_pending.setdefault(vector.name, vector)
+        else:
+            self.send_message(vector.to_update_message())
+
+    def send_fanout(self, fanout: FanOut):
+        if self._router:
+            self._router.process_message(fanout.message, self, fanout=fanout)
+
     def message_from_client(self, msg: IndiMessage):
         if isinstance(msg, message.GetProperties):
             if not msg.name:
                 for k, v in self._vectors.items():
-                    self.send_message(v.to_def_message())
+                    self.send_fanout(v.def_snapshot())
             else:
                 if msg.name in self._vectors:
                     v = self._vectors[msg.name]
-                    self.send_message(v.to_def_message())
+                    self.send_fanout(v.def_snapshot())
 
         if isinstance(msg, message.news.NewVector):
             self._vectors[msg.name].from_new_message(msg)
@@ -22,6 +22,16 @@ from indi.message import const
 
 
 class Vector(EventSourceDefinition):
+    """Vector definition.
+
+    `min_interval` (or `max_rate_hz`) limits how often set messages
+    of the vector are sent. Values are updated immediately,
+    changes made within the interval are sent together when it passes.
+
+    With `delta` enabled set messages carry only elements
+    changed since the previous set message.
+    """
+
     element_class: Type[Element]
     instance_class: Type[instance_vectors.Vector]
 
@@ -34,6 +44,9 @@ class Vector(EventSourceDefinition):
         timeout: float = 0,
         enabled: bool = True,
         elements: Optional[Dict[str, Element]] = None,
+        min_interval: float = 0,
+        max_rate_hz: Optional[float] = None,
+        delta: bool = False,
     ):
         super().__init__()
         self.name = name
@@ -42,6 +55,8 @@ class Vector(EventSourceDefinition):
         self.perm = perm
         self.timeout = timeout
         self.enabled = enabled
+        self.min_interval = max(min_interval, 1 / max_rate_hz if max_rate_hz else 0)
+        self.delta = delta
 
         if not elements:
             raise Exception("No vector elements declared")
@@ -57,6 +57,7 @@ class Element(EventSource):
     @enabled.setter
     def enabled(self, value: bool):
         self._enabled = value
+        self._vector.invalidate_def_snapshot()
 
     @property
     def value(self):
@@ -72,7 +73,10 @@ class Element(EventSource):
         prev_value = self._value
         self.check_value_type(value)
         self._value = self.check_value(value)
-        self.device.send_message(self._vector.to_set_message())
+        if prev_value != self._value:
+            self._vector.mark_dirty(self)
+        self._vector.invalidate_def_snapshot()
+        self._vector.send_set_message()
 
         if prev_value != self._value:
             e = events.Change(element=self, old_value=prev_value, new_value=self._value)
@@ -89,7 +93,11 @@ class Element(EventSource):
         self.set_value(msg.value)
 
     def reset_value(self, value):
+        prev_value = self._value
         self._value = self.check_value(value)
+        if prev_value != self._value:
+            self._vector.mark_dirty(self)
+        self._vector.invalidate_def_snapshot()
 
     def check_value(self, value):
         return value
@@ -163,7 +171,11 @@ class Switch(Element):
         self.value = const.SwitchState.ON if value else const.SwitchState.OFF
 
     def reset_bool_value(self, value):
+        prev_value = self._value
         self._value = const.SwitchState.ON if value else const.SwitchState.OFF
+        if prev_value != self._value:
+            self._vector.mark_dirty(self)
+        self._vector.invalidate_def_snapshot()
 
 
 class Light(Element):
@@ -187,12 +199,12 @@ class BLOB(Element):
             )
         return self.set_message_class(
             name=self._definition.name,
-            value=self.value.binary_base64,
+            binary=self.value.binary,
             format=self.value.format,
             size=self.value.size,
         )
 
     def set_value_from_message(self, msg):
-        blob_value = values.BLOB.from_base64(msg.value, msg.format)
+        blob_value = values.BLOB(msg.binary, msg.format)
         assert msg.size == blob_value.size
         self.set_value(blob_value)
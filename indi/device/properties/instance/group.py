@@ -45,7 +45,8 @@ class Group:
     def enabled(self, value: bool):
         self._enabled = value
         for k, v in self._vectors.items():
-            self.device.send_message(v.to_def_message())
+            v.invalidate_def_snapshot()
+            self.device.send_fanout(v.def_snapshot())
             self.device.send_message(v.to_set_message())
 
 
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Optional, Tuple, Type, Union, cast
+import asyncio
+import math
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Tuple, Type, Union, cast
 
 from indi import message
 from indi.device.properties.instance.elements import Element, Switch
 from indi.message import checks, const
+from indi.routing import FanOut
 
 if TYPE_CHECKING:
     from indi.device.driver import Driver
@@ -14,6 +19,26 @@ if TYPE_CHECKING:
 
 
 class Vector:
+    """Vector of a driver.
+
+    Definition message answering `getProperties` is kept as a snapshot
+    (`def_snapshot`) serialized at most once per wire format.
+    Snapshot is invalidated whenever enabled flags, state or values change.
+
+    Changes made inside `batch()` context are sent as a single set message
+    when the outermost context exits.
+
+    If definition sets `min_interval`, set messages are throttled:
+    a change within the interval after the last sent message
+    is sent when the interval passes, with values current at that time.
+    Without running event loop messages are sent immediately.
+
+    In `delta` mode set messages carry only elements changed
+    since the previous set message, unless a full one is requested
+    with `send_set_message(full=True)`.
+    Set messages following definitions are always full.
+    """
+
     def_message_class: Type[message.DefVector]
     set_message_class: Union[
         Type[message.SetBLOBVector],
@@ -40,6 +65,15 @@ class Vector:
         self._elements_by_name: Dict[str, Element] = {
             v.name: v for k, v in self._elements.items()
         }
+        self._def_snapshot: Optional[FanOut] = None
+        self._batch_depth = 0
+        self._batch_pending = False
+        self._last_published = -math.inf
+        self._throttled: Optional[asyncio.TimerHandle] = None
+        self.delta = definition.delta
+        self._dirty: Dict[str, None] = {}
+        self._state_dirty = False
+        self._full_pending = False
 
     def __getattr__(self, item: str):
         element = self._elements.get(item)
@@ -67,7 +101,8 @@ class Vector:
     @enabled.setter
     def enabled(self, value: bool):
         self._enabled = value
-        self.device.send_message(self.to_def_message())
+        self.invalidate_def_snapshot()
+        self.device.send_fanout(self.def_snapshot())
         self.device.send_message(self.to_set_message())
 
     @property
@@ -77,7 +112,75 @@ class Vector:
     @state_.setter
     def state_(self, value: const.StateType):
         self._state = checks.dictionary(value, const.State)
-        self.device.send_message(self.to_set_message())
+        self._state_dirty = True
+        self.invalidate_def_snapshot()
+        self.send_set_message()
+
+    @contextmanager
+    def batch(self) -> Iterator[Vector]:
+        """Defers set message until all changes are done.
+
+        >>> with vector.batch():
+        ...     vector.ra.value = 10.5
+        ...     vector.dec.value = 45.0
+        ...     vector.state_ = const.State.OK
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_pending:
+                self._batch_pending = False
+                self._publish()
+
+    def mark_dirty(self, element: Element):
+        self._dirty[element.name] = None
+
+    def send_set_message(self, full: bool = False):
+        if full:
+            self._full_pending = True
+
+        if self._batch_depth > 0:
+            self._batch_pending = True
+        else:
+            self._publish()
+
+    def _publish(self):
+        interval = self._definition.min_interval
+        if interval <= 0:
+            self.device.send_vector_update(self)
+            return
+
+        if self._throttled is not None:
+            # trailing message is already scheduled
+            return
+
+        wait = self._last_published + interval - time.monotonic()
+        if wait > 0:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                self._throttled = loop.call_later(wait, self._publish_throttled)
+                return
+
+        self._publish_throttled()
+
+    def _publish_throttled(self):
+        self._throttled = None
+        self._last_published = time.monotonic()
+        self.device.send_vector_update(self)
+
+    def def_snapshot(self) -> FanOut:
+        """Definition message of the vector (or its deletion if disabled)."""
+        if self._def_snapshot is None or not self.device.cache_definitions:
+            self._def_snapshot = FanOut(self.to_def_message())
+        return self._def_snapshot
+
+    def invalidate_def_snapshot(self):
+        self._def_snapshot = None
 
     def to_def_message(self) -> Union[message.DefVector, message.DelProperty]:
         if not self.enabled:
@@ -102,13 +205,29 @@ class Vector:
             children=elements,
         )
 
-    def to_set_message(self) -> Optional[message.SetVector]:
+    def _set_message_elements(self, delta: bool) -> Tuple[message.IndiMessagePart, ...]:
+        elements = tuple(
+            e.to_set_message()
+            for k, e in self._elements.items()
+            if e.enabled and (not delta or e.name in self._dirty)
+        )
+        self._dirty.clear()
+        self._state_dirty = False
+        return elements
+
+    def to_update_message(self) -> Optional[message.SetVector]:
+        """Set message to be sent after changes, respecting `delta` mode."""
+        delta = self.delta and not self._full_pending
+        self._full_pending = False
+        if delta and not self._dirty and not self._state_dirty:
+            return None
+        return self.to_set_message(delta=delta)
+
+    def to_set_message(self, delta: bool = False) -> Optional[message.SetVector]:
         if not self.enabled:
             return None
 
-        elements = tuple(
-            e.to_set_message() for k, e in self._elements.items() if e.enabled
-        )
+        elements = self._set_message_elements(delta)
         return self.set_message_class(
             device=self.device.name,
             name=self._definition.name,
@@ -192,6 +311,7 @@ class SwitchVector(Vector):
                 for k, el in self._elements.items():
                     if el != sender and el._value == const.SwitchState.ON:
                         el._value = const.SwitchState.OFF
+                        self.mark_dirty(el)
         else:
             if self._definition.rule in (const.SwitchRule.ONE_OF_MANY,):
                 if (
@@ -254,11 +374,11 @@ class LightVector(Vector):
             children=elements,
         )
 
-    def to_set_message(self):
+    def to_set_message(self, delta: bool = False):
         if not self.enabled:
             return None
 
-        elements = [e.to_set_message() for k, e in self._elements.items() if e.enabled]
+        elements = self._set_message_elements(delta)
         return self.set_message_class(
             device=self.device.name,
             name=self._definition.name,
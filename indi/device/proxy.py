@@ -43,6 +43,9 @@ class Proxy(Driver):
     def accepts(self, device: Optional[str]):
         return True
 
+    def routing_name(self) -> Optional[str]:
+        return None
+
     @on(general.connection.connect, Change)
     def connect(self, event):
         connected = self.get_group("general").connection.connect.bool_value
@@ -4,11 +4,11 @@ import base64
 import hashlib
 import math
 import re
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 
 class BLOB:
-    def __init__(self, binary: bytes, format: str):
+    def __init__(self, binary: Union[bytes, bytearray], format: str):
         self.binary = binary
         self.format = format
 
@@ -1,7 +1,7 @@
 import datetime
 from typing import NewType
 
-from .base import IndiMessage, Message
+from .base import IndiMessage, IndiMessagePart, Message
 from .defs import (
     DefBLOBVector,
     DefLightVector,
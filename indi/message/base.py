@@ -3,15 +3,48 @@ from __future__ import annotations
 import xml.etree.cElementTree as ET
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 
+from indi.message import serializer
+
 if TYPE_CHECKING:
     from indi.message import TimestampType
 
 
+def _slots_schema(cls: type) -> Tuple[str, ...]:
+    """Collects public slots of class and its bases, base classes first."""
+    fields: List[str] = []
+    for klass in reversed(cls.__mro__):
+        for name in klass.__dict__.get("__slots__", ()):
+            if not name.startswith("_") and name not in fields:
+                fields.append(name)
+    return tuple(fields)
+
+
 class IndiMessage:
+    """Base class for all INDI messages.
+
+    Messages use `__slots__`. Public slots of the class and its bases
+    make up the ordered field schema (`fields`).
+    All fields except `value` and `children` are XML attributes.
+    They are serialized in alphabetical order (`xml_attributes`).
+    """
+
+    __slots__: Tuple[str, ...] = ("device",)
+
     from_device = False
     from_client = False
 
+    fields: Tuple[str, ...] = ("device",)
+    xml_attributes: Tuple[str, ...] = ("device",)
+
     _message_classes: List[Type[IndiMessage]] = []
+    _message_classes_by_tag: Dict[str, Type[IndiMessage]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.fields = _slots_schema(cls)
+        cls.xml_attributes = tuple(
+            sorted(k for k in cls.fields if k not in ("children", "value"))
+        )
 
     def __init__(self, device=None, **junk):
         self.device = device
@@ -23,6 +56,7 @@ class IndiMessage:
     @classmethod
     def register_message(cls, message_class):
         cls._message_classes.append(message_class)
+        cls._message_classes_by_tag[message_class.tag_name()] = message_class
         return message_class
 
     @classmethod
@@ -32,11 +66,7 @@ class IndiMessage:
     @classmethod
     def from_xml(cls, xml: ET.Element) -> IndiMessage:
         tag = xml.tag
-        message_class = None
-
-        for subclass in cls.all_message_classes():
-            if subclass.tag_name() == tag:
-                message_class = subclass
+        message_class = cls._message_classes_by_tag.get(tag)
 
         if not message_class:
             raise Exception(f"Invalid message: {tag}")
@@ -59,17 +89,11 @@ class IndiMessage:
         xml = ET.fromstring(string)
         return cls.from_xml(xml)
 
+    def _attribute_values(self) -> List[Tuple[str, Any]]:
+        return [(k, getattr(self, k)) for k in self.xml_attributes]
+
     def to_xml(self):
-        kwargs = {
-            k: str(v)
-            for k, v in sorted(self.__dict__.items())
-            if v is not None
-            and k
-            not in (
-                "children",
-                "value",
-            )
-        }
+        kwargs = {k: str(v) for k, v in self._attribute_values() if v is not None}
 
         element = ET.Element(self.__class__.tag_name(), **kwargs)
 
@@ -82,28 +106,29 @@ class IndiMessage:
 
         return element
 
+    def write_xml(self, out: List[str]):
+        serializer.write_element(
+            out,
+            self.__class__.tag_name(),
+            self._attribute_values(),
+            getattr(self, "value", None),
+            getattr(self, "children", ()),
+        )
+
     def to_string(self) -> bytes:
-        xml = self.to_xml()
-        return b'<?xml version="1.0"?>\n' + ET.tostring(xml) + b"\n"
+        out = [serializer.XML_HEADER]
+        self.write_xml(out)
+        out.append("\n")
+        return serializer.to_bytes(out)
 
     def to_dict(self):
-        res = {
-            k: str(v)
-            for k, v in sorted(self.__dict__.items())
-            if v is not None
-            and k
-            not in (
-                "children",
-                "value",
-            )
-        }
+        res = {k: str(v) for k, v in self._attribute_values() if v is not None}
 
         if getattr(self, "value", None) is not None:
             res["_value"] = str(self.value)
 
         if hasattr(self, "children"):
-            for child in self.children:
-                res["_children"] = child.to_dict()
+            res["_children"] = [child.to_dict() for child in self.children]
 
         return res
 
@@ -112,6 +137,8 @@ class IndiMessage:
 
 
 class Message(IndiMessage):
+    __slots__ = ("timestamp", "message")
+
     from_device = True
 
     def __init__(
@@ -127,6 +154,25 @@ class Message(IndiMessage):
 
 
 class IndiMessagePart:
+    """Base class for elements of vector messages.
+
+    Field schema is built from `__slots__` like in `IndiMessage`,
+    but XML attributes keep the order of the schema.
+    """
+
+    __slots__: Tuple[str, ...] = ("name", "value")
+
+    fields: Tuple[str, ...] = ("name", "value")
+    xml_attributes: Tuple[str, ...] = ("name",)
+
+    _part_classes_by_tag: Dict[str, Type[IndiMessagePart]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.fields = _slots_schema(cls)
+        cls.xml_attributes = tuple(k for k in cls.fields if k != "value")
+        IndiMessagePart._part_classes_by_tag[cls.tag_name()] = cls
+
     def __init__(self, name, value, **junk):
         self.name = name
         self.value = self.check_value(value)
@@ -138,26 +184,12 @@ class IndiMessagePart:
     def tag_name(cls):
         return cls.__name__[:1].lower() + cls.__name__[1:]
 
-    @classmethod
-    def _all_subclasses(cls):
-        all_subclasses = []
-
-        for subclass in cls.__subclasses__():
-            all_subclasses.append(subclass)
-            all_subclasses.extend(subclass._all_subclasses())
-
-        return set(all_subclasses)
-
     @classmethod
     def from_xml(cls, xml):
         tag = xml.tag
-        message_class = None
-
-        for subclass in cls._all_subclasses():
-            if subclass.tag_name() == tag:
-                message_class = subclass
+        message_class = cls._part_classes_by_tag.get(tag)
 
-        if not message_class:
+        if not message_class or not issubclass(message_class, cls):
             raise Exception(f"Invalid part: {tag}")
 
         kwargs = xml.attrib
@@ -166,12 +198,11 @@ class IndiMessagePart:
 
         return message_class(**kwargs)
 
+    def _attribute_values(self) -> List[Tuple[str, Any]]:
+        return [(k, getattr(self, k)) for k in self.xml_attributes]
+
     def to_xml(self, parent):
-        kwargs = {
-            k: str(v)
-            for k, v in self.__dict__.items()
-            if v is not None and k not in ("value",)
-        }
+        kwargs = {k: str(v) for k, v in self._attribute_values() if v is not None}
 
         element = ET.SubElement(parent, self.__class__.tag_name(), **kwargs)
         if self.value is not None:
@@ -179,14 +210,18 @@ class IndiMessagePart:
 
         return element
 
+    def write_xml(self, out: List[str]):
+        serializer.write_element(
+            out,
+            self.__class__.tag_name(),
+            self._attribute_values(),
+            self.value,
+        )
+
     def to_dict(self):
-        res = {
-            k: str(v)
-            for k, v in sorted(self.__dict__.items())
-            if v is not None and k not in ("value",)
-        }
+        res = {k: str(v) for k, v in self._attribute_values() if v is not None}
 
-        if getattr(self, "value", None) is not None:
+        if self.value is not None:
             res["_value"] = str(self.value)
 
         return res
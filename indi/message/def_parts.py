@@ -5,21 +5,27 @@ from indi.message.base import IndiMessagePart
 
 
 class DefIndiMessagePart(IndiMessagePart):
+    __slots__ = ("label",)
+
     def __init__(self, name: str, value=None, label: Optional[str] = None, **junk):
         super().__init__(name=name, value=value)
         self.label = label
 
 
 class DefBLOB(DefIndiMessagePart):
-    pass
+    __slots__ = ()
 
 
 class DefLight(DefIndiMessagePart):
+    __slots__ = ()
+
     def check_value(self, value):
         return checks.dictionary(value, const.State)
 
 
 class DefNumber(DefIndiMessagePart):
+    __slots__ = ("format", "min", "max", "step")
+
     def __init__(
         self,
         name: str,
@@ -42,9 +48,11 @@ class DefNumber(DefIndiMessagePart):
 
 
 class DefSwitch(DefIndiMessagePart):
+    __slots__ = ()
+
     def check_value(self, value):
         return checks.dictionary(value, const.SwitchState)
 
 
 class DefText(DefIndiMessagePart):
-    pass
+    __slots__ = ()
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
 
 
 class DefVector(IndiMessage):
+    __slots__ = ("name", "state", "label", "group", "timestamp", "message", "children")
+
     from_device = True
     children_class: Union[
         Type[DefBLOB], Type[DefLight], Type[DefNumber], Type[DefSwitch], Type[DefText]
@@ -46,6 +48,8 @@ class DefVector(IndiMessage):
 
 
 class DefWritableVector(DefVector):
+    __slots__ = ("perm", "timeout")
+
     def __init__(
         self,
         *args,
@@ -60,21 +64,26 @@ class DefWritableVector(DefVector):
 
 @IndiMessage.register_message
 class DefBLOBVector(DefWritableVector):
+    __slots__ = ()
     children_class = DefBLOB
 
 
 @IndiMessage.register_message
 class DefLightVector(DefVector):
+    __slots__ = ()
     children_class = DefLight
 
 
 @IndiMessage.register_message
 class DefNumberVector(DefWritableVector):
+    __slots__ = ()
     children_class = DefNumber
 
 
 @IndiMessage.register_message
 class DefSwitchVector(DefWritableVector):
+    __slots__ = ("rule",)
+
     children_class = DefSwitch
 
     def __init__(self, *args, rule: const.SwitchRuleType, **kwargs):
@@ -84,4 +93,5 @@ class DefSwitchVector(DefWritableVector):
 
 @IndiMessage.register_message
 class DefTextVector(DefWritableVector):
+    __slots__ = ()
     children_class = DefText
@@ -10,6 +10,8 @@ if TYPE_CHECKING:
 
 @IndiMessage.register_message
 class DelProperty(IndiMessage):
+    __slots__ = ("name", "timestamp", "message")
+
     from_device = True
 
     def __init__(
@@ -6,6 +6,14 @@ from indi.message.base import IndiMessage
 
 @IndiMessage.register_message
 class EnableBLOB(IndiMessage):
+    """Sets BLOB policy of a client.
+
+    `shm="1"` asks the server to pass BLOB payloads through shared memory,
+    which is an extension understood only by this library.
+    """
+
+    __slots__ = ("name", "shm", "value")
+
     from_client = True
 
     def __init__(
@@ -13,8 +21,10 @@ class EnableBLOB(IndiMessage):
         device: str,
         value: const.BLOBEnableType,
         name: Optional[str] = None,
+        shm: Optional[str] = None,
         **junk
     ):
         super().__init__(device)
         self.name = name
+        self.shm = shm
         self.value = checks.dictionary(value, const.BLOBEnable)
@@ -5,6 +5,8 @@ from indi.message.base import IndiMessage
 
 @IndiMessage.register_message
 class GetProperties(IndiMessage):
+    __slots__ = ("version", "name")
+
     from_device = True
     from_client = True
 
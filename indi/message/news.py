@@ -17,6 +17,8 @@ if TYPE_CHECKING:
 
 
 class NewVector(IndiMessage):
+    __slots__ = ("name", "timestamp", "children")
+
     children_class: Union[
         Type[OneBLOB], Type[OneNumber], Type[OneSwitch], Type[OneText]
     ]
@@ -38,19 +40,23 @@ class NewVector(IndiMessage):
 
 @IndiMessage.register_message
 class NewBLOBVector(NewVector):
+    __slots__ = ()
     children_class = OneBLOB
 
 
 @IndiMessage.register_message
 class NewNumberVector(NewVector):
+    __slots__ = ()
     children_class = OneNumber
 
 
 @IndiMessage.register_message
 class NewSwitchVector(NewVector):
+    __slots__ = ()
     children_class = OneSwitch
 
 
 @IndiMessage.register_message
 class NewTextVector(NewVector):
+    __slots__ = ()
     children_class = OneText
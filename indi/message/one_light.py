@@ -3,6 +3,8 @@ from indi.message.base import IndiMessage
 
 @IndiMessage.register_message
 class OneLight(IndiMessage):
+    __slots__ = ("name", "value")
+
     from_device = True
 
     def __init__(self, name: str, value, **junk):
@@ -1,28 +1,87 @@
+import base64
+from typing import Optional, Union
+
 from indi.message import checks, const
 from indi.message.base import IndiMessagePart
 
 
 class OneBLOB(IndiMessagePart):
-    def __init__(self, name: str, size: float, format: str, value, **junk):
+    """BLOB element of a vector.
+
+    Payload is available both as base64 encoded `value` and decoded `binary`.
+    Whichever is missing is computed from the other one on access,
+    so BLOBs received with streaming decoding are not encoded again
+    unless they need to be serialized.
+
+    Payload of BLOB received over shared memory side channel
+    is read from the file given in `shm` on first access.
+    """
+
+    __slots__ = ("size", "format", "shm", "_binary", "_value")
+
+    def __init__(
+        self,
+        name: str,
+        size: float,
+        format: str,
+        value=None,
+        binary: Optional[Union[bytes, bytearray]] = None,
+        shm: Optional[str] = None,
+        **junk
+    ):
+        self._binary = binary
         super().__init__(name=name, value=value)
         self.size = size
         self.format = format
+        self.shm = shm
+
+    @property
+    def value(self) -> Optional[str]:
+        if self._value is None and self._binary is not None:
+            return base64.b64encode(self._binary).decode("latin1")
+        return self._value
+
+    @value.setter
+    def value(self, value: Optional[str]):
+        self._value = value
+
+    @property
+    def binary(self) -> Optional[Union[bytes, bytearray]]:
+        if self._binary is None and self._value is not None:
+            self._binary = base64.b64decode(self._value)
+        if self._binary is None and self.shm is not None:
+            from indi.message import shared_blob
+
+            self._binary = shared_blob.read(self.shm)
+        return self._binary
+
+    @binary.setter
+    def binary(self, binary: Optional[Union[bytes, bytearray]]):
+        self._binary = binary
+        if binary is not None:
+            self._value = None
 
 
 class OneLight(IndiMessagePart):
+    __slots__ = ()
+
     def check_value(self, value):
         return checks.dictionary(value, const.State)
 
 
 class OneNumber(IndiMessagePart):
+    __slots__ = ()
+
     def check_value(self, value):
         return checks.number(value)
 
 
 class OneSwitch(IndiMessagePart):
+    __slots__ = ()
+
     def check_value(self, value):
         return checks.dictionary(value, const.SwitchState)
 
 
 class OneText(IndiMessagePart):
-    pass
+    __slots__ = ()
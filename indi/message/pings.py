@@ -3,6 +3,8 @@ from indi.message.base import IndiMessage
 
 @IndiMessage.register_message
 class PingReply(IndiMessage):
+    __slots__ = ("uid",)
+
     from_client = True
 
     def __init__(self, uid: str, **junk):
@@ -12,6 +14,8 @@ class PingReply(IndiMessage):
 
 @IndiMessage.register_message
 class PingRequest(IndiMessage):
+    __slots__ = ("uid",)
+
     from_device = True
 
     def __init__(self, uid: str, **junk):
@@ -0,0 +1,75 @@
+"""Direct XML serializer for INDI messages.
+
+Produces exactly the same bytes as `ElementTree.tostring` called on `to_xml()` result,
+but writes tags, attributes and escaped text straight into a list of strings,
+without building an element tree.
+"""
+
+from typing import List, Optional, Sequence
+
+XML_HEADER = '<?xml version="1.0"?>\n'
+
+
+def escape_attribute(text: str) -> str:
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    if '"' in text:
+        text = text.replace('"', "&quot;")
+    if "\r" in text:
+        text = text.replace("\r", "&#13;")
+    if "\n" in text:
+        text = text.replace("\n", "&#10;")
+    if "\t" in text:
+        text = text.replace("\t", "&#09;")
+    return text
+
+
+def escape_text(text: str) -> str:
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def write_element(
+    out: List[str],
+    tag: str,
+    attributes: Sequence[tuple],
+    value,
+    children: Sequence = (),
+):
+    """Writes single element with its children to `out`.
+
+    :param out: List of string chunks
+    :param tag: Tag name
+    :param attributes: Sequence of (name, value) pairs, None values are skipped
+    :param value: Element text, skipped if None
+    :param children: Sequence of message parts written as child elements
+    """
+    out.append("<")
+    out.append(tag)
+    for name, attr_value in attributes:
+        if attr_value is not None:
+            out.append(f' {name}="{escape_attribute(str(attr_value))}"')
+
+    text: Optional[str] = str(value) if value is not None else None
+    if text or children:
+        out.append(">")
+        if text:
+            out.append(escape_text(text))
+        for child in children:
+            child.write_xml(out)
+        out.append(f"</{tag}>")
+    else:
+        out.append(" />")
+
+
+def to_bytes(out: List[str]) -> bytes:
+    return "".join(out).encode("ascii", "xmlcharrefreplace")
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
 
 
 class SetVector(IndiMessage):
+    __slots__ = ("name", "state", "timeout", "timestamp", "message", "children")
+
     child_class: Union[
         Type[OneBLOB], Type[OneLight], Type[OneNumber], Type[OneSwitch], Type[OneText]
     ]
@@ -45,24 +47,29 @@ class SetVector(IndiMessage):
 
 @IndiMessage.register_message
 class SetBLOBVector(SetVector):
+    __slots__ = ()
     child_class = OneBLOB
 
 
 @IndiMessage.register_message
 class SetLightVector(SetVector):
+    __slots__ = ()
     child_class = OneLight
 
 
 @IndiMessage.register_message
 class SetNumberVector(SetVector):
+    __slots__ = ()
     child_class = OneNumber
 
 
 @IndiMessage.register_message
 class SetSwitchVector(SetVector):
+    __slots__ = ()
     child_class = OneSwitch
 
 
 @IndiMessage.register_message
 class SetTextVector(SetVector):
+    __slots__ = ()
     child_class = OneText
@@ -0,0 +1,121 @@
+"""Shared memory side channel for BLOB payloads.
+
+Clients running on the same host as the server can ask for it
+by sending `enableBLOB` with `shm="1"` attribute.
+Payloads of `setBLOBVector` messages are then written to files
+in shared memory directory and `oneBLOB` elements only carry file path
+in `shm` attribute instead of base64 encoded data.
+"""
+
+import atexit
+import logging
+import os
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple, Union
+
+from indi.message.base import IndiMessage
+from indi.message.one_parts import OneBLOB
+from indi.message.sets import SetBLOBVector
+
+logger = logging.getLogger(__name__)
+
+SHM_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else "/tmp"
+FILE_PREFIX = "indipy-blob-"
+
+ElementKey = Tuple[Optional[str], Optional[str], str]
+
+
+class SharedBLOBStore:
+    """Writes BLOB payloads to shared memory files.
+
+    Only the last `generations` payloads of every element are kept,
+    older files are removed when new ones are written.
+    Remaining files are removed on interpreter exit.
+    """
+
+    _instance = None
+
+    def __init__(self, directory: str = SHM_DIR, generations: int = 2) -> None:
+        assert generations > 0, "At least one generation has to be kept"
+        self.directory = directory
+        self.generations = generations
+        self._counter = 0
+        self._files: Dict[ElementKey, Deque[str]] = {}
+        atexit.register(self.clear)
+
+    @classmethod
+    def instance(cls):
+        if not cls._instance:
+            cls._instance = cls()
+        return cls._instance
+
+    def write(self, key: ElementKey, binary: Union[bytes, bytearray]) -> str:
+        self._counter += 1
+        path = os.path.join(
+            self.directory, f"{FILE_PREFIX}{os.getpid()}-{self._counter}"
+        )
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(binary)
+
+        files = self._files.setdefault(key, deque())
+        files.append(path)
+        while len(files) > self.generations:
+            self._remove(files.popleft())
+        return path
+
+    def share(self, device: Optional[str], vector: Optional[str], part: OneBLOB):
+        binary = part.binary
+        if binary is None:
+            return part
+        try:
+            path = self.write((device, vector, part.name), binary)
+        except OSError:
+            logger.exception("SharedBLOBStore: cannot write BLOB, sending inline")
+            return part
+        return OneBLOB(name=part.name, size=part.size, format=part.format, shm=path)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        for files in self._files.values():
+            for path in files:
+                self._remove(path)
+        self._files.clear()
+
+
+def read(path: str) -> bytearray:
+    """Reads BLOB payload written by `SharedBLOBStore`."""
+    directory, name = os.path.split(os.path.abspath(path))
+    if directory != os.path.abspath(SHM_DIR) or not name.startswith(FILE_PREFIX):
+        raise ValueError(f"Not a shared BLOB file: {path}")
+
+    with open(path, "rb") as f:
+        binary = bytearray(os.fstat(f.fileno()).st_size)
+        f.readinto(binary)
+    return binary
+
+
+def to_string(message: IndiMessage) -> bytes:
+    """Serializes message moving BLOB payloads to shared memory."""
+    if not isinstance(message, SetBLOBVector):
+        return message.to_string()
+
+    store = SharedBLOBStore.instance()
+    children = tuple(
+        store.share(message.device, message.name, part) for part in message.children
+    )
+    return SetBLOBVector(
+        device=message.device,
+        name=message.name,
+        state=message.state,
+        timeout=message.timeout,
+        timestamp=message.timestamp,
+        message=message.message,
+        children=children,
+    ).to_string()
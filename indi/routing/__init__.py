@@ -1,3 +1,4 @@
 from .client import Client
 from .device import Device
+from .fanout import FanOut, WireClient
 from .router import Router
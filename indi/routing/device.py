@@ -9,3 +9,11 @@ class Device:
 
     def accepts(self, device: Optional[str]) -> bool:
         raise Exception("Not implemented")
+
+    def routing_name(self) -> Optional[str]:
+        """Name of the only device this device accepts messages for.
+
+        Router uses it to index devices by name.
+        Devices returning None are asked with `accepts` about every message.
+        """
+        return None
@@ -0,0 +1,50 @@
+from typing import Callable, Dict
+
+from indi.message import IndiMessage, shared_blob
+from indi.routing.client import Client
+
+WIRE_FORMATS: Dict[str, Callable[[IndiMessage], bytes]] = {
+    "xml": lambda message: message.to_string(),
+    # BLOB payloads passed through shared memory, for same-host clients
+    "xml+shm": shared_blob.to_string,
+}
+
+
+class WireClient(Client):
+    """Client receiving messages already serialized to its wire format.
+
+    Transports sending messages to the network should implement `data_from_device`
+    so the router can reuse one serialization for all of them.
+    """
+
+    wire_format = "xml"
+
+    def message_from_device(self, message: IndiMessage):
+        self.data_from_device(message, FanOut(message).data(self.wire_format))
+
+    def data_from_device(self, message: IndiMessage, data: bytes):
+        raise Exception("Not implemented")
+
+
+class FanOut:
+    """Delivers single message to many clients.
+
+    Message is serialized lazily, at most once per wire format.
+    """
+
+    def __init__(self, message: IndiMessage) -> None:
+        self.message = message
+        self._data: Dict[str, bytes] = {}
+
+    def data(self, wire_format: str) -> bytes:
+        data = self._data.get(wire_format)
+        if data is None:
+            data = WIRE_FORMATS[wire_format](self.message)
+            self._data[wire_format] = data
+        return data
+
+    def deliver(self, client: Client):
+        if isinstance(client, WireClient):
+            client.data_from_device(self.message, self.data(client.wire_format))
+        else:
+            client.message_from_device(self.message)
@@ -1,8 +1,8 @@
 import logging
-from typing import Dict, List, Optional, Union, cast
+from typing import Dict, List, Optional, Tuple, Union
 
-from indi.message import EnableBLOB, IndiMessage, NewBLOBVector, const
-from indi.routing import Client, Device
+from indi.message import EnableBLOB, IndiMessage, SetBLOBVector, const
+from indi.routing import Client, Device, FanOut
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +14,11 @@ class Router:
     """Message router
 
     Passess messages between device drivers and client connections.
+
+    Devices are indexed by their `routing_name`,
+    devices without one are asked with `accepts` about every message.
+    Clients are pre-bucketed by device name and BLOB/non-BLOB message kind
+    according to their BLOB policies.
     """
 
     _instance = None
@@ -26,6 +31,10 @@ class Router:
         self.blob_routing: Dict[
             SenderType, Dict[Optional[str], const.BLOBEnableType]
         ] = {}
+        self._devices_by_name: Dict[str, List[Device]] = {}
+        self._wildcard_devices: List[Device] = []
+        self._default_clients: Dict[bool, List[Client]] = {False: [], True: []}
+        self._device_clients: Dict[Tuple[Optional[str], bool], List[Client]] = {}
 
     @classmethod
     def instance(cls):
@@ -33,14 +42,33 @@ class Router:
             cls._instance = cls()
         return cls._instance
 
+    @staticmethod
+    def _policy_accepts(policy: const.BLOBEnableType, is_blob: bool) -> bool:
+        if is_blob:
+            return policy in (const.BLOBEnable.ALSO, const.BLOBEnable.ONLY)
+        return policy in (const.BLOBEnable.NEVER, const.BLOBEnable.ALSO)
+
     def register_device(self, device: Device):
         self.devices.append(device)
 
+        name = device.routing_name() if isinstance(device, Device) else None
+        if name is None:
+            self._wildcard_devices.append(device)
+        else:
+            self._devices_by_name.setdefault(name, []).append(device)
+
     def register_client(self, client: Client):
         logger.debug("Router: registering client %s", client)
         self.clients.append(client)
         self.blob_routing[client] = {}
 
+        for is_blob, bucket in self._default_clients.items():
+            if self._policy_accepts(self.DEFAULT_BLOB_POLICY, is_blob):
+                bucket.append(client)
+        for (_, is_blob), bucket in self._device_clients.items():
+            if self._policy_accepts(self.DEFAULT_BLOB_POLICY, is_blob):
+                bucket.append(client)
+
     def unregister_client(self, client: Client):
         logger.debug("Router: unregistering client %s", client)
         if client in self.clients:
@@ -48,33 +76,69 @@ class Router:
         if client in self.blob_routing:
             del self.blob_routing[client]
 
-    def process_message(self, message: IndiMessage, sender: SenderType = None):
-        is_blob = isinstance(message, NewBLOBVector)
-
+        for bucket in (
+            *self._default_clients.values(),
+            *self._device_clients.values(),
+        ):
+            if client in bucket:
+                bucket.remove(client)
+
+    def _devices_for(self, device_name: Optional[str]) -> List[Device]:
+        if device_name is None:
+            return [
+                device
+                for device in self.devices
+                if device not in self._wildcard_devices or device.accepts(None)
+            ]
+
+        return self._devices_by_name.get(device_name, []) + [
+            device for device in self._wildcard_devices if device.accepts(device_name)
+        ]
+
+    def _clients_for(self, device_name: Optional[str], is_blob: bool) -> List[Client]:
+        bucket = self._device_clients.get((device_name, is_blob))
+        if bucket is None:
+            return self._default_clients[is_blob]
+        return bucket
+
+    def process_message(
+        self,
+        message: IndiMessage,
+        sender: SenderType = None,
+        fanout: Optional[FanOut] = None,
+    ):
         if message.from_client:
             if isinstance(message, EnableBLOB):
                 self.process_enable_blob(message, sender)
 
-            for device in self.devices:
-                if not device == sender and device.accepts(message.device):
+            for device in self._devices_for(message.device):
+                if not device == sender:
                     device.message_from_client(message)
 
         if message.from_device:
-            for client in self.clients:
+            is_blob = isinstance(message, SetBLOBVector)
+            if fanout is None:
+                fanout = FanOut(message)
+            for client in self._clients_for(message.device, is_blob):
                 if not client == sender:
-                    device_name = getattr(message, "device")
-                    client_blob_policy = self.blob_routing.get(client, {}).get(
-                        device_name, self.DEFAULT_BLOB_POLICY
-                    )
-                    if (
-                        is_blob
-                        and client_blob_policy
-                        in (
-                            const.BLOBEnable.ALSO,
-                            const.BLOBEnable.ONLY,
-                        )
-                    ) or (not is_blob and client_blob_policy == const.BLOBEnable.NEVER):
-                        client.message_from_device(message)
+                    fanout.deliver(client)
 
     def process_enable_blob(self, message: EnableBLOB, sender: SenderType):
-        self.blob_routing[sender][message.device] = message.value
+        device_name = message.device
+        self.blob_routing[sender][device_name] = message.value
+
+        if not isinstance(sender, Client):
+            return
+
+        if (device_name, False) not in self._device_clients:
+            for is_blob in (False, True):
+                self._device_clients[(device_name, is_blob)] = list(
+                    self._default_clients[is_blob]
+                )
+
+        for is_blob in (False, True):
+            bucket = self._device_clients[(device_name, is_blob)]
+            if sender in bucket:
+                bucket.remove(sender)
+            if self._policy_accepts(message.value, is_blob):
+                bucket.append(sender)
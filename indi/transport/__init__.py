@@ -1 +1,2 @@
 from .buffer import Buffer
+from .read_size import ReadSize
@@ -1,99 +1,241 @@
+import binascii
 import logging
+import re
 import xml.etree.ElementTree as ET
-from io import StringIO
-from typing import Callable, Optional
+from typing import Callable, List, Optional, Union
 
-from indi.message import IndiMessage
+from indi.message import IndiMessage, one_parts
 
 logger = logging.getLogger(__name__)
 
+# upper limit of memory preallocated for BLOB payload based on declared `size`
+MAX_BLOB_PREALLOCATION = 256 * 1024 * 1024
+
+
+class _Base64Decoder:
+    """Incremental base64 decoder writing into preallocated `bytearray`."""
+
+    def __init__(self, size_hint: int) -> None:
+        self.binary = bytearray(min(max(size_hint, 0), MAX_BLOB_PREALLOCATION))
+        self.length = 0
+        self.pending = b""
+        self.has_data = False
+
+    def feed(self, text: str):
+        self.has_data = True
+        chunk = self.pending + text.encode("latin1").translate(None, b" \t\r\n")
+        usable = len(chunk) - len(chunk) % 4
+        self.pending = chunk[usable:]
+        self._write(binascii.a2b_base64(chunk[:usable]))
+
+    def _write(self, decoded: bytes):
+        end = self.length + len(decoded)
+        self.binary[self.length : end] = decoded
+        self.length = end
+
+    def finish(self) -> Optional[bytearray]:
+        if not self.has_data:
+            return None
+        if self.pending:
+            self._write(binascii.a2b_base64(self.pending))
+        del self.binary[self.length :]
+        return self.binary
+
+
+class _MessageBuilder:
+    """XML parser target building top level INDI message elements.
+
+    Text of `oneBLOB` elements is base64-decoded as it arrives,
+    so the encoded payload is never kept as a whole string.
+    """
+
+    def __init__(self) -> None:
+        self.builder = ET.TreeBuilder()
+        self.depth = 0
+        self.root: Optional[ET.Element] = None
+        self.blob_decoder: Optional[_Base64Decoder] = None
+        self.blobs: List[Optional[bytearray]] = []
+
+    def start(self, tag: str, attrib: dict):
+        self.depth += 1
+        if self.depth == 2 and tag == one_parts.OneBLOB.tag_name():
+            try:
+                size_hint = int(attrib.get("size", 0))
+            except ValueError:
+                size_hint = 0
+            self.blob_decoder = _Base64Decoder(size_hint)
+        return self.builder.start(tag, attrib)
+
+    def data(self, data: str):
+        if self.blob_decoder is not None:
+            self.blob_decoder.feed(data)
+        else:
+            self.builder.data(data)
+
+    def end(self, tag: str):
+        element = self.builder.end(tag)
+        if self.blob_decoder is not None:
+            self.blobs.append(self.blob_decoder.finish())
+            self.blob_decoder = None
+
+        self.depth -= 1
+        if self.depth == 0:
+            self.root = element
+        return element
+
+    def close(self):
+        return self.builder.close()
+
+    def message(self) -> IndiMessage:
+        assert self.root is not None
+        message = IndiMessage.from_xml(self.root)
+
+        blob_parts = (
+            part
+            for part in getattr(message, "children", ())
+            if isinstance(part, one_parts.OneBLOB)
+        )
+        for part, binary in zip(blob_parts, self.blobs):
+            part.binary = binary
+
+        return message
+
 
 class Buffer:
+    """Receive buffer splitting incoming byte stream into INDI messages.
+
+    Data is kept in a `bytearray` with a moving read offset,
+    so consuming a message does not copy the rest of the buffer.
+    Consumed bytes are released when the offset grows past `compaction_threshold`.
+    """
+
+    compaction_threshold = 65536
+
     def __init__(self) -> None:
         self.max_buffer_size_before_frontal_cleanup: Optional[int] = 2048
-        self.buffer = StringIO()
+        self.buffer = bytearray()
+        self.offset = 0
         self.allowed_tags = [m.tag_name() for m in IndiMessage.all_message_classes()]
+        self.discarded_bytes = 0
+        self._start_tag_re = re.compile(
+            b"<(?:"
+            + b"|".join(re.escape(tag.encode("latin1")) for tag in self.allowed_tags)
+            + b")"
+        )
+        self._max_start_tag_len = 1 + max(len(tag) for tag in self.allowed_tags)
+        self._parser: Optional[ET.XMLParser] = None
+        self._builder: Optional[_MessageBuilder] = None
+        self._fed = 0
 
-    def append(self, data: str):
-        self.buffer.write(data)
+    def append(self, data: Union[bytes, str]):
+        if isinstance(data, str):
+            data = data.encode("latin1")
+        self.buffer += data
 
     @property
-    def data(self) -> str:
-        return self.buffer.getvalue()
+    def data(self) -> bytes:
+        return bytes(self.buffer[self.offset :])
 
     @data.setter
-    def data(self, value: str):
-        self.buffer = StringIO()
+    def data(self, value: Union[bytes, str]):
+        self.buffer = bytearray()
+        self.offset = 0
         self.append(value)
+        self._parser = None
 
     @property
-    def data_len(self):
-        return self.buffer.tell()
+    def data_len(self) -> int:
+        return len(self.buffer) - self.offset
 
-    def _cleanup_buffer(self):
-        start = None
+    def _consume(self, length: int):
+        """Drops `length` bytes from the beginning of the buffer.
 
-        data = self.data
-        # find first occurrence of any known xml tag:
-        for tag in self.allowed_tags:
-            lookup = "<" + tag
-            found_pos = data.find(lookup)
-            if found_pos >= 0:
-                start = min(start, found_pos) if start is not None else found_pos
+        Only moves the read offset, memory is reclaimed by occasional compaction.
+        """
+        self.offset += length
+        self._parser = None
 
-            if start == 0:
-                break
+        if self.offset >= len(self.buffer):
+            self.buffer.clear()
+            self.offset = 0
+        elif self.offset > self.compaction_threshold and self.offset * 2 > len(
+            self.buffer
+        ):
+            del self.buffer[: self.offset]
+            self.offset = 0
 
-        if start is not None:
-            if start > 0:
-                self.data = data[start:]
+    def _cleanup_buffer(self):
+        if self._parser is not None:
+            # beginning of the buffer is already being parsed as a message
             return
 
-        # if no known tags found
-        # search for the last xml tag opening
-        # just in case it's the part of valid message
-        # and the rest will arrive soon
-        last_tag_pos = data.rfind("<")
-        if last_tag_pos >= 0:
-            start = last_tag_pos
-
-        if start is not None:
-            if start > 0:
-                self.data = data[start:]
-            return
+        # find first occurrence of any known xml tag:
+        match = self._start_tag_re.search(self.buffer, self.offset)
+        if match:
+            start = match.start()
+        else:
+            # if no known tags found
+            # keep the trailing xml tag opening
+            # just in case it's the beginning of valid message
+            # and the rest will arrive soon
+            tail_pos = max(self.offset, len(self.buffer) - self._max_start_tag_len + 1)
+            start = self.buffer.find(b"<", tail_pos)
+            if start < 0:
+                # neither known tag nor xml opening found in the buffer
+                # we can safely assume everything is junk and discard it
+                start = len(self.buffer)
 
-        # neither known tag nor xml opening found in the buffer
-        # we can safely assume everything is junk and discard it
-        self.data = ""
+        if start > self.offset:
+            self._discard(start - self.offset)
+
+    def _discard(self, length: int):
+        logger.debug("Buffer: discarding %s bytes of junk", length)
+        self.discarded_bytes += length
+        self._consume(length)
 
     def _cleanup_beginning(self):
-        self.data = self.data[1:]
+        self._discard(1)
         self._cleanup_buffer()
 
     def _find_message_in_buffer(self):
-        end = 0
-        data = self.data
-        while end < len(data) - 1:
-            end = data.find(">", end)
-            if end < 0:
-                return None, None
+        """Feeds not yet parsed part of the buffer to incremental XML parser.
+
+        Parser state is kept between calls, so every character is parsed only once
+        as long as the beginning of the buffer does not change.
+        Data is fed up to every `>` character, so the position where top level
+        element ends is known exactly.
 
-            end += 1
+        :return: Tuple of parsed message and its end position,
+            `(None, None)` if more data is needed to complete the message
+            or `(None, end)` if the beginning of the buffer is not a valid message
+        :rtype: tuple
+        """
+        if self._parser is None or self._builder is None:
+            self._builder = _MessageBuilder()
+            self._parser = ET.XMLParser(target=self._builder, encoding="iso-8859-1")
+            self._fed = 0
 
-            partial = data[:end]
+        data = self.buffer
+        pos = self.offset + self._fed
+        while pos < len(data):
+            end = data.find(b">", pos)
+            end = len(data) if end < 0 else end + 1
 
             try:
-                ET.fromstring(partial)
-                is_correct_xml = True
-            except ET.ParseError:
-                is_correct_xml = False
+                with memoryview(data) as view:
+                    self._parser.feed(view[pos:end])
+            except (ET.ParseError, binascii.Error):
+                return None, self._fed + end - pos
+            self._fed += end - pos
+            pos = end
 
-            if is_correct_xml:
+            if self._builder.root is not None:
                 try:
-                    message = IndiMessage.from_string(partial)
-                    return message, end
+                    return self._builder.message(), self._fed
                 except Exception:
                     logger.warning("Buffer: Contents is not a valid message")
+                    return None, self._fed
+
         return None, None
 
     def process(self, callback: Callable[[IndiMessage], None]):
@@ -101,12 +243,17 @@ class Buffer:
         while self.data_len:
             message, end = self._find_message_in_buffer()
 
-            if not message and self.max_buffer_size_before_frontal_cleanup is not None:
-                if self.data_len > self.max_buffer_size_before_frontal_cleanup:
+            if not message and end is not None:
+                self._cleanup_beginning()
+                continue
+
+            if not message:
+                max_size = self.max_buffer_size_before_frontal_cleanup
+                if max_size is not None and self.data_len > max_size:
                     self._cleanup_beginning()
                     continue
                 break
 
-            self.data = self.data[end:]
+            self._consume(end)
             self._cleanup_buffer()
             callback(message)
@@ -1 +1,2 @@
 from .tcp import TCP
+from .unix import UNIX
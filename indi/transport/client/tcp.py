@@ -1,9 +1,9 @@
 import asyncio
 import logging
-from typing import Callable
+from typing import Callable, List, Optional, Tuple
 
 from indi.message import IndiMessage
-from indi.transport import Buffer
+from indi.transport import Buffer, ReadSize
 
 logger = logging.getLogger(__name__)
 
@@ -15,49 +15,101 @@ class ConnectionHandler:
         writer: asyncio.StreamWriter,
         callback: Callable[[IndiMessage], None],
         for_blobs=False,
+        read_size: Optional[ReadSize] = None,
+        flush_window: float = 0,
+        shared_memory: bool = False,
     ):
         self.buffer = Buffer()
+        self.read_size = read_size or ReadSize()
         if for_blobs:
             self.buffer.max_buffer_size_before_frontal_cleanup = None
 
         self.reader, self.writer = reader, writer
         self.callback = callback
-        self.sender_lock = asyncio.Lock()
+        self.flush_window = flush_window
+        self.shared_memory = shared_memory
+        self.pending: List[bytes] = []
+        self.writer_task: Optional[asyncio.Task] = None
 
     async def wait_for_messages(self):
         while True:
             logger.debug("TCP: waiting for data")
-            message = await self.reader.read(1024)
+            message = await self.reader.read(self.read_size.size)
             if not message:
                 logger.debug("TCP: no data, breaking")
                 break
+            self.read_size.update(len(message))
             logger.debug("TCP: got data: %s", message)
-            self.buffer.append(message.decode("latin1"))
+            self.buffer.append(message)
             self.buffer.process(self.message_from_server)
 
     def message_from_server(self, message: IndiMessage):
         self.callback(message)
 
     def send_message(self, message: IndiMessage):
-        data = message.to_string()
-        asyncio.get_running_loop().create_task(self.send(data))
+        self.pending.append(message.to_string())
+        if self.writer_task is None:
+            self.writer_task = asyncio.get_running_loop().create_task(
+                self.write_messages()
+            )
+
+    async def write_messages(self):
+        try:
+            if self.flush_window > 0:
+                await asyncio.sleep(self.flush_window)
+            while self.pending:
+                batch, self.pending = self.pending, []
+                await self.send(b"".join(batch))
+        finally:
+            self.writer_task = None
 
     async def send(self, data: bytes):
-        async with self.sender_lock:
-            logger.debug("TCP: sending data: %s", data)
-            self.writer.write(data)
-            await self.writer.drain()
+        logger.debug("TCP: sending data: %s", data)
+        self.writer.write(data)
+        await self.writer.drain()
 
     def close(self):
+        if self.writer_task is not None:
+            self.writer_task.cancel()
         self.writer.close()
 
 
 class TCP:
-    def __init__(self, address: str = "127.0.0.1", port: int = 7624):
+    def __init__(
+        self,
+        address: str = "127.0.0.1",
+        port: int = 7624,
+        read_size: int = 1024,
+        adaptive_read: bool = False,
+        max_read_size: int = 1048576,
+        flush_window: float = 0,
+        shared_memory: bool = False,
+    ):
         self.address = address
         self.port = port
+        self.read_size = read_size
+        self.adaptive_read = adaptive_read
+        self.max_read_size = max_read_size
+        self.flush_window = flush_window
+        self.shared_memory = shared_memory
+
+    async def open_connection(
+        self,
+    ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        return await asyncio.open_connection(self.address, self.port)
 
     async def connect(self, callback: Callable[[IndiMessage], None], for_blobs=False):
-        reader, writer = await asyncio.open_connection(self.address, self.port)
-        handler = ConnectionHandler(reader, writer, callback, for_blobs=for_blobs)
+        reader, writer = await self.open_connection()
+        read_size = ReadSize(
+            self.read_size, adaptive=self.adaptive_read, max_size=self.max_read_size
+        )
+        handler = ConnectionHandler(
+            reader,
+            writer,
+            callback,
+            for_blobs=for_blobs,
+            read_size=read_size,
+            flush_window=self.flush_window,
+            shared_memory=self.shared_memory,
+        )
         return handler
@@ -0,0 +1,22 @@
+import asyncio
+from typing import Tuple
+
+from indi.transport.client.tcp import TCP
+
+
+class UNIX(TCP):
+    """Connection to INDI server over UNIX domain socket.
+
+    Accepts the same options as `TCP` client except for address and port.
+    """
+
+    DEFAULT_PATH = "/tmp/indiserver"
+
+    def __init__(self, path: str = DEFAULT_PATH, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+
+    async def open_connection(
+        self,
+    ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        return await asyncio.open_unix_connection(self.path)
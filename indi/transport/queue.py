@@ -0,0 +1,218 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from indi.message import (
+    DefVector,
+    DelProperty,
+    IndiMessage,
+    Message,
+    SetBLOBVector,
+    SetVector,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy:
+    """What `OutboundQueue` does with a new message when it is full."""
+
+    # drop the oldest queued non-BLOB set message
+    DROP_OLDEST = "drop_oldest"
+    # replace queued set message of the same vector,
+    # dropping the oldest non-BLOB set message when there is none
+    COALESCE = "coalesce"
+    # give up on the client
+    DISCONNECT = "disconnect"
+
+
+VectorKey = Tuple[Optional[str], Optional[str]]
+
+
+class _Entry:
+    __slots__ = ("message", "data", "key")
+
+    def __init__(self, message: IndiMessage, data: bytes, key: Optional[VectorKey]):
+        self.message = message
+        self.data = data
+        self.key = key
+
+
+class OutboundQueue:
+    """Bounded queue of serialized messages waiting to be sent to a client.
+
+    Only set messages are ever dropped or coalesced,
+    definitions, deletions and messages are always delivered.
+    They are also barriers for coalescing: set message queued before
+    a definition, deletion or message of its device is never replaced
+    by one queued after it, neither is set message carrying message text.
+
+    With `coalesce` enabled queued set message is replaced by newer one
+    of the same vector even if the queue is not full,
+    so a client falling behind receives current state instead of history.
+
+    :param max_size: Maximum number of queued messages
+    :type max_size: int
+    :param policy: Overflow policy, one of `OverflowPolicy` values
+    :type policy: str
+    :param coalesce: Always replace queued updates of the same vector
+    :type coalesce: bool
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        policy: str = OverflowPolicy.DROP_OLDEST,
+        coalesce: bool = False,
+    ) -> None:
+        assert max_size > 0, "Queue size has to be positive"
+        assert policy in (
+            OverflowPolicy.DROP_OLDEST,
+            OverflowPolicy.COALESCE,
+            OverflowPolicy.DISCONNECT,
+        ), f"Unknown overflow policy: {policy}"
+        self.max_size = max_size
+        self.policy = policy
+        self.coalesce = coalesce
+        self.max_depth = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.overflowed = False
+        self._entries: Deque[_Entry] = deque()
+        self._pending: Dict[VectorKey, _Entry] = {}
+        self._ready: Optional[asyncio.Event] = None
+
+    @property
+    def depth(self) -> int:
+        return len(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _vector_key(message: IndiMessage) -> Optional[VectorKey]:
+        if isinstance(message, SetVector):
+            return message.device, message.name
+        return None
+
+    def _barrier(self, message: IndiMessage):
+        if isinstance(message, Message) and message.device is None:
+            self._pending.clear()
+        elif isinstance(message, Message) or (
+            isinstance(message, DelProperty) and message.name is None
+        ):
+            for key in [key for key in self._pending if key[0] == message.device]:
+                del self._pending[key]
+        else:
+            self._pending.pop((message.device, getattr(message, "name", None)), None)
+
+    def _coalesce(self, entry: _Entry) -> bool:
+        if entry.key is None:
+            return False
+        queued = self._pending.get(entry.key)
+        if queued is None:
+            return False
+
+        new, old = entry.message, queued.message
+        assert isinstance(new, SetVector) and isinstance(old, SetVector)
+        if old.message is not None:
+            return False
+
+        # partial update cannot replace one carrying more elements
+        names = {part.name for part in new.children}
+        if not all(part.name in names for part in old.children):
+            return False
+
+        queued.message = entry.message
+        queued.data = entry.data
+        self.coalesced += 1
+        return True
+
+    def _drop_oldest(self) -> bool:
+        for i, entry in enumerate(self._entries):
+            if isinstance(entry.message, SetVector) and not isinstance(
+                entry.message, SetBLOBVector
+            ):
+                del self._entries[i]
+                if entry.key is not None and self._pending.get(entry.key) is entry:
+                    del self._pending[entry.key]
+                self.dropped += 1
+                return True
+        return False
+
+    def put(self, message: IndiMessage, data: bytes) -> bool:
+        """Queues serialized message.
+
+        :return: False if the queue overflowed and the client should be disconnected
+        :rtype: bool
+        """
+        if self.overflowed:
+            return False
+
+        entry = _Entry(message, data, self._vector_key(message))
+        if isinstance(message, (DefVector, DelProperty, Message)):
+            self._barrier(message)
+
+        if self.coalesce and self._coalesce(entry):
+            return True
+
+        if len(self._entries) >= self.max_size:
+            if self.policy == OverflowPolicy.COALESCE and self._coalesce(entry):
+                return True
+            if self.policy == OverflowPolicy.DISCONNECT or not self._drop_oldest():
+                logger.warning(
+                    "OutboundQueue: queue full (%s messages), disconnecting client",
+                    len(self._entries),
+                )
+                self.overflowed = True
+                self.clear()
+                return False
+            logger.debug("OutboundQueue: queue full, dropped oldest update")
+
+        self._entries.append(entry)
+        if entry.key is not None:
+            self._pending[entry.key] = entry
+        self.max_depth = max(self.max_depth, len(self._entries))
+        if self._ready is not None:
+            self._ready.set()
+        return True
+
+    def get_nowait(self) -> Optional[bytes]:
+        if not self._entries:
+            return None
+        entry = self._entries.popleft()
+        if entry.key is not None and self._pending.get(entry.key) is entry:
+            del self._pending[entry.key]
+        return entry.data
+
+    async def get(self) -> bytes:
+        """Waits for the next queued message."""
+        while True:
+            data = self.get_nowait()
+            if data is not None:
+                return data
+            if self._ready is None:
+                self._ready = asyncio.Event()
+            self._ready.clear()
+            await self._ready.wait()
+
+    async def get_batch(self, flush_window: float = 0) -> List[bytes]:
+        """Waits for queued messages and takes all of them.
+
+        :param flush_window: Time in seconds to wait for more messages
+            after the first one arrives
+        :type flush_window: float
+        """
+        batch = [await self.get()]
+        if flush_window > 0:
+            await asyncio.sleep(flush_window)
+        while True:
+            data = self.get_nowait()
+            if data is None:
+                return batch
+            batch.append(data)
+
+    def clear(self):
+        self._entries.clear()
+        self._pending.clear()
@@ -0,0 +1,32 @@
+class ReadSize:
+    """Size of chunks read from a stream.
+
+    Fixed size is used unless `adaptive` is enabled.
+    In adaptive mode the size doubles (up to `max_size`) every time a read
+    fills the whole chunk, which means more data is waiting in the stream,
+    and halves (down to `min_size`) when a read returns less than a quarter of it,
+    which is typical for interactive traffic.
+    """
+
+    def __init__(
+        self, size: int = 1024, adaptive: bool = False, max_size: int = 1048576
+    ):
+        assert size > 0, "Read size has to be positive"
+        self.min_size = size
+        self.max_size = max(size, max_size)
+        self.adaptive = adaptive
+        self.size = size
+
+    def update(self, received: int):
+        """Adjusts read size after a read.
+
+        :param received: Number of bytes returned by the last read
+        :type received: int
+        """
+        if not self.adaptive:
+            return
+
+        if received >= self.size:
+            self.size = min(self.size * 2, self.max_size)
+        elif received < self.size // 4:
+            self.size = max(self.size // 2, self.min_size)
@@ -1,2 +1,3 @@
 from .tcp import TCP
 from .tty import TTY
+from .unix import UNIX
@@ -1,31 +1,58 @@
 import asyncio
 import logging
-from typing import List
+from typing import List, Optional
 
-from indi.message import IndiMessage
-from indi.routing import Client, Router
-from indi.transport import Buffer
+from indi.message import EnableBLOB, IndiMessage
+from indi.routing import Router, WireClient
+from indi.transport import Buffer, ReadSize
+from indi.transport.queue import OutboundQueue, OverflowPolicy
 
 logger = logging.getLogger(__name__)
 
 
-class ConnectionHandler(Client):
+class ConnectionHandler(WireClient):
     connections: List["ConnectionHandler"] = []
 
     def __init__(
-        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, router: Router
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        router: Router,
+        read_size: Optional[ReadSize] = None,
+        queue: Optional[OutboundQueue] = None,
+        flush_window: float = 0,
+        shared_memory: bool = False,
     ):
         self.buffer = Buffer()
+        self.read_size = read_size or ReadSize()
+        self.queue = queue if queue is not None else OutboundQueue()
+        self.flush_window = flush_window
+        self.shared_memory = shared_memory
         self.reader, self.writer = reader, writer
         self.router = router
-        self.sender_lock = asyncio.Lock()
+        self.writer_task: Optional[asyncio.Task] = None
         if self.router:
             self.router.register_client(self)
 
     @classmethod
-    def handler(cls, router: Router):
+    def handler(
+        cls,
+        router: Router,
+        read_size: Optional[ReadSize] = None,
+        queue: Optional[OutboundQueue] = None,
+        flush_window: float = 0,
+        shared_memory: bool = False,
+    ):
         async def handler_func(reader, writer):
-            conn = cls(reader, writer, router)
+            conn = cls(
+                reader,
+                writer,
+                router,
+                read_size=read_size,
+                queue=queue,
+                flush_window=flush_window,
+                shared_memory=shared_memory,
+            )
             cls.connections.append(conn)
             try:
                 await conn.wait_for_messages()
@@ -40,52 +67,115 @@ class ConnectionHandler(Client):
     async def wait_for_messages(self):
         while True:
             logger.debug(f"TCP: waiting for data")
-            message = await self.reader.read(1024)
+            message = await self.reader.read(self.read_size.size)
             if not message:
                 logger.debug(f"TCP: no data, breaking")
                 break
+            self.read_size.update(len(message))
             logger.debug("TCP: got data: %s", message)
-            self.buffer.append(message.decode("latin1"))
+            self.buffer.append(message)
             self.buffer.process(self.message_from_client)
 
     def message_from_client(self, message: IndiMessage):
+        if isinstance(message, EnableBLOB) and message.shm == "1":
+            if self.shared_memory:
+                logger.debug("TCP: passing BLOBs through shared memory")
+                self.wire_format = "xml+shm"
+            else:
+                logger.warning("TCP: shared memory BLOBs are not allowed")
+
         if self.router:
             self.router.process_message(message, sender=self)
 
-    def message_from_device(self, message: IndiMessage):
-        data = message.to_string()
-        asyncio.get_running_loop().create_task(self.send(data))
+    def data_from_device(self, message: IndiMessage, data: bytes):
+        if self.queue.overflowed:
+            return
+
+        loop = asyncio.get_running_loop()
+        if not self.queue.put(message, data):
+            logger.warning("TCP: client is too slow, disconnecting")
+            # router may be iterating over its clients right now
+            loop.call_soon(self.close)
+            return
+
+        if self.writer_task is None:
+            self.writer_task = loop.create_task(self.write_messages())
+
+    async def write_messages(self):
+        try:
+            while True:
+                batch = await self.queue.get_batch(self.flush_window)
+                await self.send(b"".join(batch))
+        except ConnectionError:
+            logger.debug("TCP: connection lost while sending data")
 
     async def send(self, data: bytes):
-        async with self.sender_lock:
-            logger.debug("TCP: sending data: %s", data)
-            self.writer.write(data)
-            await self.writer.drain()
+        logger.debug("TCP: sending data: %s", data)
+        self.writer.write(data)
+        await self.writer.drain()
 
     def close(self):
+        if self.writer_task is not None:
+            self.writer_task.cancel()
         self.writer.close()
         if self.router:
             self.router.unregister_client(self)
 
 
 class TCP:
-    def __init__(self, router: Router, address="0.0.0.0", port=7624):
+    def __init__(
+        self,
+        router: Router,
+        address="0.0.0.0",
+        port=7624,
+        read_size: int = 1024,
+        adaptive_read: bool = False,
+        max_read_size: int = 1048576,
+        queue_size: int = 1024,
+        overflow_policy: str = OverflowPolicy.DROP_OLDEST,
+        coalesce: bool = False,
+        flush_window: float = 0,
+        shared_memory: bool = False,
+    ):
         self.address = address
         self.port = port
         self.router = router
+        self.read_size = read_size
+        self.adaptive_read = adaptive_read
+        self.max_read_size = max_read_size
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        self.coalesce = coalesce
+        self.flush_window = flush_window
+        self.shared_memory = shared_memory
 
     async def client_connected(
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
     ):
-        handler = ConnectionHandler.handler(self.router)
+        read_size = ReadSize(
+            self.read_size, adaptive=self.adaptive_read, max_size=self.max_read_size
+        )
+        queue = OutboundQueue(
+            self.queue_size, policy=self.overflow_policy, coalesce=self.coalesce
+        )
+        handler = ConnectionHandler.handler(
+            self.router,
+            read_size=read_size,
+            queue=queue,
+            flush_window=self.flush_window,
+            shared_memory=self.shared_memory,
+        )
         await handler(reader, writer)
 
-    async def start(self):
+    async def start_server(self) -> asyncio.AbstractServer:
         logger.info("Starting async TCP INDI server on %s:%s", self.address, self.port)
-        server = await asyncio.start_server(
+        return await asyncio.start_server(
             self.client_connected, self.address, self.port
         )
 
+    async def start(self):
+        server = await self.start_server()
+
         try:
             async with server:
                 await server.serve_forever()
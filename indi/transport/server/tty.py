@@ -1,30 +1,23 @@
 import asyncio
 import logging
-from typing import Optional
+import sys
+from typing import BinaryIO, Optional
 
-import aiofiles
-from aiofiles.threadpool.text import AsyncTextIndirectIOWrapper
-
-from indi.message import IndiMessage
-from indi.routing import Client, Router
-from indi.transport import Buffer
+from indi.routing import Router
+from indi.transport import ReadSize
+from indi.transport.queue import OutboundQueue
+from indi.transport.server import tcp
 
 logger = logging.getLogger(__name__)
 
 
-class ConnectionHandler(Client):
-    def __init__(
-        self,
-        router: Router,
-        stdin: AsyncTextIndirectIOWrapper,
-        stdout: AsyncTextIndirectIOWrapper,
-    ) -> None:
-        self.stdin = stdin
-        self.stdout = stdout
-        self.buffer = Buffer()
-        self.router = router
-        if self.router:
-            self.router.register_client(self)
+class ConnectionHandler(tcp.ConnectionHandler):
+    """Connection with INDI server running the driver as a subprocess.
+
+    Standard input and output are connected to the event loop as pipes,
+    so reading and writing is done without threads,
+    with the same framing and batched writes as TCP connections.
+    """
 
     async def handle(self):
         try:
@@ -35,48 +28,46 @@ class ConnectionHandler(Client):
         logger.info("Stopping INDIpy server on TTY")
         self.close()
 
-    async def wait_for_messages(self):
-        while True:
-            logger.debug(f"Waiting for data")
-            message = await self._read()
-            if not message:
-                logger.debug(f"No data, exiting")
-                break
-            logger.debug("Received data: %s", message)
-            self.buffer.append(message)
-            self.buffer.process(self.message_from_client)
-
-    def message_from_client(self, message: IndiMessage):
-        self.router.process_message(message, sender=self)
-
-    def message_from_device(self, message: IndiMessage):
-        data = message.to_string().decode("latin1")
-        logger.debug("Sending data: %s", data)
-        asyncio.get_running_loop().create_task(self._write(data))
-
-    def close(self):
-        self.router.unregister_client(self)
-
-    async def _read(self) -> str:
-        return await self.stdin.readline()
-
-    async def _write(self, data: str):
-        await self.stdout.write(data)
-        await self.stdout.flush()
-
 
 class TTY:
     def __init__(
         self,
         router: Router,
-        stdin: Optional[AsyncTextIndirectIOWrapper] = None,
-        stdout: Optional[AsyncTextIndirectIOWrapper] = None,
+        stdin: Optional[BinaryIO] = None,
+        stdout: Optional[BinaryIO] = None,
+        read_size: int = 65536,
+        flush_window: float = 0,
     ) -> None:
         self.router = router
-        self.stdin: AsyncTextIndirectIOWrapper = stdin or aiofiles.stdin
-        self.stdout: AsyncTextIndirectIOWrapper = stdout or aiofiles.stdout
+        self.stdin: BinaryIO = stdin or sys.stdin.buffer
+        self.stdout: BinaryIO = stdout or sys.stdout.buffer
+        self.read_size = read_size
+        self.flush_window = flush_window
+
+    async def connect(self):
+        loop = asyncio.get_running_loop()
+
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), self.stdin
+        )
+
+        transport, protocol = await loop.connect_write_pipe(
+            asyncio.streams.FlowControlMixin, self.stdout
+        )
+        writer = asyncio.StreamWriter(transport, protocol, None, loop)
+
+        return reader, writer
 
     async def start(self):
         logger.info("Starting INDIpy server on TTY")
-        conn_handler = ConnectionHandler(self.router, self.stdin, self.stdout)
+        reader, writer = await self.connect()
+        conn_handler = ConnectionHandler(
+            reader,
+            writer,
+            self.router,
+            read_size=ReadSize(self.read_size),
+            queue=OutboundQueue(),
+            flush_window=self.flush_window,
+        )
         await conn_handler.handle()
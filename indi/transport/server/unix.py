@@ -0,0 +1,43 @@
+import asyncio
+import logging
+import os
+import stat
+
+from indi.routing import Router
+from indi.transport.server.tcp import TCP
+
+logger = logging.getLogger(__name__)
+
+
+class UNIX(TCP):
+    """INDI server listening on UNIX domain socket.
+
+    Accepts the same options as `TCP` server except for address and port.
+    Clients are allowed to receive BLOBs through shared memory
+    unless `shared_memory` is disabled.
+    """
+
+    DEFAULT_PATH = "/tmp/indiserver"
+
+    def __init__(self, router: Router, path: str = DEFAULT_PATH, **kwargs):
+        kwargs.setdefault("shared_memory", True)
+        super().__init__(router, **kwargs)
+        self.path = path
+
+    def _remove_stale_socket(self):
+        try:
+            if stat.S_ISSOCK(os.stat(self.path).st_mode):
+                os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    async def start_server(self) -> asyncio.AbstractServer:
+        logger.info("Starting async UNIX socket INDI server on %s", self.path)
+        self._remove_stale_socket()
+        return await asyncio.start_unix_server(self.client_connected, self.path)
+
+    async def start(self):
+        try:
+            await super().start()
+        finally:
+            self._remove_stale_socket()
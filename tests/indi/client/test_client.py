@@ -0,0 +1,158 @@
+import asyncio
+
+import pytest
+
+from indi import message
+from indi.client import events
+from indi.client.client import BaseClient
+from indi.message import const, def_parts, one_parts
+
+
+class DummyClient(BaseClient):
+    def __init__(self):
+        super().__init__()
+        self.sent = []
+
+    def send_message(self, msg):
+        self.sent.append(msg)
+
+
+def define(client, device="DEVICE", vector="VECTOR"):
+    client.process_message(
+        message.DefNumberVector(
+            device=device,
+            name=vector,
+            state=const.State.OK,
+            perm=const.Permissions.READ_ONLY,
+            children=[
+                def_parts.DefNumber(
+                    name="VALUE", value="1", format="%.0f", min=0, max=10, step=1
+                )
+            ],
+        )
+    )
+
+
+def update(client, value, device="DEVICE", vector="VECTOR"):
+    client.process_message(
+        message.SetNumberVector(
+            device=device,
+            name=vector,
+            state=const.State.OK,
+            children=[one_parts.OneNumber(name="VALUE", value=value)],
+        )
+    )
+
+
+def test_callbacks_called_for_matching_events_in_registration_order():
+    client = DummyClient()
+    calls = []
+
+    def register(name, **kwargs):
+        client.onevent(callback=lambda event: calls.append((name, event)), **kwargs)
+
+    register("any")
+    register("value", event_type=events.ValueUpdate)
+    register("element", device="DEVICE", vector="VECTOR", element="VALUE")
+    register("other device", device="OTHER")
+    register("definition", vector="VECTOR", event_type=events.DefinitionUpdate)
+
+    define(client)
+    names = [
+        name for name, event in calls if isinstance(event, events.DefinitionUpdate)
+    ]
+    assert names == ["any", "definition"]
+
+    calls.clear()
+    update(client, "5")
+    names = [name for name, event in calls if isinstance(event, events.ValueUpdate)]
+    assert names == ["any", "value", "element"]
+
+
+def test_rmonevent_by_uuid_and_by_filter():
+    client = DummyClient()
+    calls = []
+
+    first = client.onevent(callback=lambda event: calls.append("first"))
+    client.onevent(callback=lambda event: calls.append("second"), device="DEVICE")
+    client.onevent(callback=lambda event: calls.append("third"), device="DEVICE")
+
+    client.rmonevent(uuid=first)
+    assert len(client.callbacks) == 2
+
+    define(client)
+    assert calls[:2] == ["second", "third"]
+    assert "first" not in calls
+
+    client.rmonevent(device="DEVICE")
+    assert len(client.callbacks) == 0
+    assert client.callbacks.buckets == {}
+
+
+def test_push_wait_returns_cached_state():
+    client = DummyClient()
+    define(client)
+
+    async def run():
+        return await client.waitforevent(
+            device="DEVICE", vector="VECTOR", element="VALUE", expect=1.0, push=True
+        )
+
+    event = asyncio.run(run())
+
+    assert isinstance(event, events.ValueUpdate)
+    assert event.new_value == 1.0
+    assert client.sent == []
+
+
+def test_push_wait_relies_on_pushed_events():
+    client = DummyClient()
+    define(client)
+
+    async def run():
+        wait = asyncio.ensure_future(
+            client.waitforevent(
+                device="DEVICE",
+                vector="VECTOR",
+                element="VALUE",
+                expect=5.0,
+                push=True,
+                timeout=1,
+            )
+        )
+        await asyncio.sleep(0)
+        update(client, "5")
+        return await wait
+
+    event = asyncio.run(run())
+
+    assert event.new_value == 5.0
+    assert client.sent == []
+    assert len(client.callbacks) == 0
+
+
+def test_wait_timeout():
+    client = DummyClient()
+    define(client)
+
+    async def run():
+        with pytest.raises(Exception, match="Timeout"):
+            await client.waitforevent(
+                device="DEVICE", vector="VECTOR", expect=const.State.ALERT, timeout=0.01
+            )
+
+    asyncio.run(run())
+    assert len(client.callbacks) == 0
+
+
+def test_refresh_requests_are_deduplicated():
+    client = DummyClient()
+
+    async def run():
+        for _ in range(3):
+            client.connection_reset()
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+
+    assert [type(msg) for msg in client.sent] == [message.GetProperties]
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import MagicMock
 
 from indi import message
@@ -179,3 +180,148 @@ def test_device_sends_set_blob_vector_message():
     assert call_msg.device == expected_msg.device
     assert call_msg.name == expected_msg.name
     assert call_msg.children == expected_msg.children
+
+
+def test_device_answers_get_properties_with_cached_snapshot():
+    router_mock = MagicMock()
+    dev = DummyDevice(router=router_mock)
+    get_properties = message.GetProperties(version="2.0", name="TEXT")
+
+    dev.message_from_client(get_properties)
+    dev.message_from_client(get_properties)
+
+    first, second = router_mock.process_message.call_args_list
+    assert first[0][0] is second[0][0]
+    assert first[1]["fanout"] is second[1]["fanout"]
+
+
+def test_device_snapshot_invalidated_by_value_change():
+    router_mock = MagicMock()
+    dev = DummyDevice(router=router_mock)
+    get_properties = message.GetProperties(version="2.0", name="TEXT")
+
+    dev.message_from_client(get_properties)
+    dev.main.text.txt.value = "new value"
+    dev.message_from_client(get_properties)
+
+    before, _, after = router_mock.process_message.call_args_list
+    assert before[0][0].children[0].value == "lorem"
+    assert after[0][0].children[0].value == "new value"
+
+
+def test_vector_batch_sends_single_set_message():
+    router_mock = MagicMock()
+    dev = DummyDevice(router=router_mock)
+
+    with dev.main.number.batch():
+        dev.main.number.num.value = 1
+        dev.main.number.snum.value = 2
+        dev.main.number.state_ = const.State.BUSY
+        router_mock.process_message.assert_not_called()
+
+    router_mock.process_message.assert_called_once()
+    msg, _ = router_mock.process_message.call_args[0]
+    assert msg.name == "NUMBER"
+    assert msg.state == const.State.BUSY
+    assert [child.value for child in msg.children] == ["1.000000", "2:00"]
+
+
+def test_driver_batch_sends_one_set_message_per_vector():
+    router_mock = MagicMock()
+    dev = DummyDevice(router=router_mock)
+
+    with dev.batch():
+        dev.main.text.txt.value = "first"
+        with dev.main.number.batch():
+            dev.main.number.num.value = 1
+        dev.main.text.txt.value = "second"
+        router_mock.process_message.assert_not_called()
+
+    sent = [call[0][0] for call in router_mock.process_message.call_args_list]
+    assert [msg.name for msg in sent] == ["TEXT", "NUMBER"]
+    assert sent[0].children[0].value == "second"
+
+
+class ThrottledDevice(Driver):
+    name = "THROTTLED"
+
+    main = properties.Group(
+        "MAIN",
+        vectors=dict(
+            position=properties.NumberVector(
+                "POSITION",
+                max_rate_hz=20,
+                elements=dict(
+                    value=properties.Number("VALUE", default=0, format="%.0f"),
+                ),
+            ),
+        ),
+    )
+
+
+def test_throttled_vector_sends_trailing_value():
+    router_mock = MagicMock()
+    dev = ThrottledDevice(router=router_mock)
+
+    async def run():
+        for value in range(1, 6):
+            dev.main.position.value.value = value
+        assert dev.main.position.value.value == 5
+        assert router_mock.process_message.call_count == 1
+        await asyncio.sleep(0.1)
+
+    asyncio.run(run())
+
+    sent = [call[0][0] for call in router_mock.process_message.call_args_list]
+    assert [msg.children[0].value for msg in sent] == ["1", "5"]
+
+
+def test_throttled_vector_without_event_loop_sends_immediately():
+    router_mock = MagicMock()
+    dev = ThrottledDevice(router=router_mock)
+
+    for value in range(1, 4):
+        dev.main.position.value.value = value
+
+    assert router_mock.process_message.call_count == 3
+
+
+class SensorDevice(Driver):
+    name = "SENSOR"
+
+    main = properties.Group(
+        "MAIN",
+        vectors=dict(
+            temperature=properties.NumberVector(
+                "TEMPERATURE",
+                delta=True,
+                elements={
+                    f"t{i}": properties.Number(f"T{i}", default=0, format="%.0f")
+                    for i in range(3)
+                },
+            ),
+        ),
+    )
+
+
+def test_delta_vector_sends_only_changed_elements():
+    router_mock = MagicMock()
+    dev = SensorDevice(router=router_mock)
+    vector = dev.main.temperature
+
+    vector.t1.value = 5
+    vector.t1.value = 5
+    with vector.batch():
+        vector.t0.value = 1
+        vector.t2.value = 2
+    vector.state_ = const.State.ALERT
+    vector.send_set_message(full=True)
+
+    sent = [call[0][0] for call in router_mock.process_message.call_args_list]
+    assert [[child.name for child in msg.children] for msg in sent] == [
+        ["T1"],
+        ["T0", "T2"],
+        [],
+        ["T0", "T1", "T2"],
+    ]
+    assert sent[2].state == const.State.ALERT
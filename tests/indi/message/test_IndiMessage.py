@@ -66,3 +66,61 @@ def test_to_string(in_xml, in_msg):
     xml = in_msg.to_string()
     expected = xml_header + in_xml + b"\n"
     assert expected == xml
+
+
+@pytest.mark.parametrize("in_xml, in_msg", messages)
+def test_messages_have_no_instance_dict(in_xml, in_msg):
+    assert not hasattr(in_msg, "__dict__")
+    for child in getattr(in_msg, "children", ()):
+        assert not hasattr(child, "__dict__")
+
+
+def test_field_schema():
+    assert message.SetTextVector.fields == (
+        "device",
+        "name",
+        "state",
+        "timeout",
+        "timestamp",
+        "message",
+        "children",
+    )
+    assert message.SetTextVector.xml_attributes == (
+        "device",
+        "message",
+        "name",
+        "state",
+        "timeout",
+        "timestamp",
+    )
+    assert def_parts.DefNumber.xml_attributes == (
+        "name",
+        "label",
+        "format",
+        "min",
+        "max",
+        "step",
+    )
+
+
+def test_eq_compares_all_children():
+    msg = message.SetTextVector(
+        device="CAMERA",
+        name="EXPOSE",
+        state=const.State.OK,
+        children=[
+            one_parts.OneText(name="FIRST", value="1"),
+            one_parts.OneText(name="SECOND", value="2"),
+        ],
+    )
+    other = message.SetTextVector(
+        device="CAMERA",
+        name="EXPOSE",
+        state=const.State.OK,
+        children=[
+            one_parts.OneText(name="OTHER", value="1"),
+            one_parts.OneText(name="SECOND", value="2"),
+        ],
+    )
+
+    assert msg != other
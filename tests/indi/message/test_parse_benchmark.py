@@ -0,0 +1,54 @@
+import time
+
+from indi import message
+from indi.message import const, def_parts
+
+NUM_ELEMENTS = 200
+NUM_PARSES = 200
+
+
+def large_def_number_vector():
+    return message.DefNumberVector(
+        device="WEATHER",
+        name="SENSORS",
+        state=const.State.OK,
+        perm=const.Permissions.READ_ONLY,
+        children=[
+            def_parts.DefNumber(
+                name=f"SENSOR_{i}",
+                format="%.2f",
+                min=-100,
+                max=100,
+                step=0.01,
+                value=f"{i}.5",
+            )
+            for i in range(NUM_ELEMENTS)
+        ],
+    )
+
+
+def test_part_dispatch_table():
+    assert message.IndiMessagePart._part_classes_by_tag["defNumber"] is (
+        def_parts.DefNumber
+    )
+    assert message.IndiMessage._message_classes_by_tag["defNumberVector"] is (
+        message.DefNumberVector
+    )
+
+
+def test_parse_large_def_number_vector_benchmark():
+    msg = large_def_number_vector()
+    xml = msg.to_string()
+
+    start = time.perf_counter()
+    for _ in range(NUM_PARSES):
+        parsed = message.IndiMessage.from_string(xml)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"\nParsed {NUM_PARSES / elapsed:.0f} defNumberVector messages/s "
+        f"({NUM_PARSES * NUM_ELEMENTS / elapsed:.0f} elements/s)"
+    )
+
+    assert msg == parsed
+    assert NUM_ELEMENTS == len(parsed.children)
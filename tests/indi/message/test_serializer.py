@@ -0,0 +1,126 @@
+import xml.etree.ElementTree as ET
+from random import choice, randint, random
+
+import pytest
+
+from indi import message
+from indi.message import const, def_parts, one_parts
+
+NUM_RANDOM_TEST_CASES = 200
+
+special_chars = "&<>\"'\t\n\r éäł€"
+safe_chars = "abcXYZ019_-.:&<>\"'éäł€"
+
+
+def random_string(chars, max_length=12):
+    return "".join(choice(chars) for _ in range(randint(1, max_length)))
+
+
+def maybe(value):
+    return value if random() > 0.3 else None
+
+
+def random_number():
+    return choice(("0", "-1", "2.5", "10:30", "-3:15:20.5"))
+
+
+def random_message(chars, kinds=tuple(range(7))):
+    kind = choice(kinds)
+    device = random_string(chars)
+    name = random_string(chars)
+    state = choice((const.State.IDLE, const.State.OK, const.State.BUSY))
+
+    if kind == 0:
+        return message.GetProperties(
+            version="1.7", device=maybe(device), name=maybe(name)
+        )
+    if kind == 1:
+        return message.Message(
+            device=maybe(device), timestamp=maybe(message.now()), message=maybe(name)
+        )
+    if kind == 2:
+        return message.DelProperty(device=device, name=maybe(name))
+    if kind == 3:
+        return message.EnableBLOB(
+            device=device, name=maybe(name), value=const.BLOBEnable.ALSO
+        )
+    if kind == 4:
+        return message.SetTextVector(
+            device=device,
+            name=name,
+            state=state,
+            timeout=maybe(randint(0, 60)),
+            message=maybe(random_string(chars)),
+            children=[
+                one_parts.OneText(name=random_string(chars), value=random_string(chars))
+                for _ in range(randint(0, 5))
+            ],
+        )
+    if kind == 5:
+        return message.DefNumberVector(
+            device=device,
+            name=name,
+            state=state,
+            perm=const.Permissions.READ_WRITE,
+            label=maybe(random_string(chars)),
+            group=maybe(random_string(chars)),
+            children=[
+                def_parts.DefNumber(
+                    name=random_string(chars),
+                    label=maybe(random_string(chars)),
+                    format="%.2f",
+                    min=randint(-10, 0),
+                    max=randint(0, 10),
+                    step=0.5,
+                    value=random_number(),
+                )
+                for _ in range(randint(0, 5))
+            ],
+        )
+    return message.NewSwitchVector(
+        device=device,
+        name=name,
+        timestamp=maybe(message.now()),
+        children=[
+            one_parts.OneSwitch(
+                name=random_string(chars),
+                value=choice((const.SwitchState.ON, const.SwitchState.OFF)),
+            )
+            for _ in range(randint(0, 5))
+        ],
+    )
+
+
+def element_tree_to_string(msg):
+    return b'<?xml version="1.0"?>\n' + ET.tostring(msg.to_xml()) + b"\n"
+
+
+@pytest.mark.parametrize(
+    "msg", [random_message(special_chars) for _ in range(NUM_RANDOM_TEST_CASES)]
+)
+def test_to_string_matches_element_tree(msg):
+    assert element_tree_to_string(msg) == msg.to_string()
+
+
+@pytest.mark.parametrize(
+    "msg",
+    [
+        # `message` is not a registered message class, so it's not parsed
+        random_message(safe_chars, kinds=(0, 2, 3, 4, 5, 6))
+        for _ in range(NUM_RANDOM_TEST_CASES)
+    ],
+)
+def test_to_string_round_trip(msg):
+    assert msg == message.IndiMessage.from_string(msg.to_string())
+
+
+def test_to_string_blob():
+    msg = message.SetBLOBVector(
+        device="CAMERA",
+        name="CCD1",
+        state=const.State.OK,
+        children=[one_parts.OneBLOB(name="CCD1", size=3, format=".txt", binary=b"abc")],
+    )
+
+    assert element_tree_to_string(msg) == msg.to_string()
+    assert msg == message.IndiMessage.from_string(msg.to_string())
@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from indi import message
+from indi.message import const, one_parts, shared_blob
+
+
+def blob_message(binary):
+    return message.SetBLOBVector(
+        device="CAMERA",
+        name="CCD1",
+        state=const.State.OK,
+        children=[
+            one_parts.OneBLOB(
+                name="CCD1", size=len(binary), format=".fits", binary=binary
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def store():
+    store = shared_blob.SharedBLOBStore.instance()
+    yield store
+    store.clear()
+
+
+def test_blob_payload_passed_through_shared_memory(store):
+    binary = os.urandom(10000)
+
+    data = shared_blob.to_string(blob_message(binary))
+
+    assert len(data) < 1000
+    received = message.IndiMessage.from_string(data)
+    part = received.children[0]
+    assert part.shm is not None
+    assert part.value is None
+    assert part.binary == binary
+    assert int(part.size) == len(binary)
+
+
+def test_other_messages_serialized_inline(store):
+    msg = message.DelProperty(device="CAMERA")
+    assert shared_blob.to_string(msg) == msg.to_string()
+
+
+def test_old_generations_are_removed(store):
+    paths = [
+        store.write(("CAMERA", "CCD1", "CCD1"), b"data")
+        for _ in range(store.generations + 1)
+    ]
+
+    assert not os.path.exists(paths[0])
+    assert all(os.path.exists(path) for path in paths[1:])
+
+
+def test_reading_files_outside_shared_memory_is_refused():
+    with pytest.raises(ValueError):
+        shared_blob.read("/etc/passwd")
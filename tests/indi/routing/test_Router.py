@@ -4,7 +4,8 @@ from unittest.mock import patch
 import pytest
 
 from indi import message
-from indi.routing import Device, Router
+from indi.message import const
+from indi.routing import Device, Router, WireClient
 
 messages = [
     ("SOME_DEVICE", ((True, True), (False, False))),
@@ -51,3 +52,141 @@ def test_message_from_device():
     router.process_message(msg)
 
     client.message_from_device.assert_called_once_with(msg)
+
+
+class RecordingWireClient(WireClient):
+    def __init__(self):
+        self.received = []
+
+    def data_from_device(self, msg, data):
+        self.received.append((msg, data))
+
+
+def test_message_from_device_serialized_once_for_all_wire_clients():
+    router = Router()
+
+    clients = [RecordingWireClient() for _ in range(3)]
+    for client in clients:
+        router.register_client(client)
+
+    msg = message.DelProperty(device="SOME_DEVICE")
+
+    with patch.object(
+        message.DelProperty, "to_string", autospec=True, return_value=b"<delProperty />"
+    ) as to_string:
+        router.process_message(msg)
+
+    to_string.assert_called_once_with(msg)
+    for client in clients:
+        assert client.received == [(msg, b"<delProperty />")]
+
+
+def test_message_filtered_out_is_not_serialized():
+    router = Router()
+
+    client = RecordingWireClient()
+    router.register_client(client)
+    router.process_message(
+        message.EnableBLOB(device="SOME_DEVICE", value=const.BLOBEnable.ONLY),
+        sender=client,
+    )
+
+    msg = message.DelProperty(device="SOME_DEVICE")
+
+    with patch.object(message.DelProperty, "to_string", autospec=True) as to_string:
+        router.process_message(msg)
+
+    to_string.assert_not_called()
+    assert client.received == []
+
+
+class NamedDevice(Device):
+    def __init__(self, name):
+        self.name = name
+        self.received = []
+
+    def accepts(self, device):
+        raise AssertionError("indexed device should not be asked")
+
+    def routing_name(self):
+        return self.name
+
+    def message_from_client(self, message):
+        self.received.append(message)
+
+
+def test_message_from_client_routed_by_device_name():
+    router = Router()
+
+    first = NamedDevice("FIRST")
+    second = NamedDevice("SECOND")
+    router.register_device(first)
+    router.register_device(second)
+
+    msg = message.GetProperties(version="2.0", device="SECOND")
+    router.process_message(msg)
+
+    assert first.received == []
+    assert second.received == [msg]
+
+    broadcast = message.GetProperties(version="2.0")
+    router.process_message(broadcast)
+
+    assert first.received == [broadcast]
+    assert second.received == [msg, broadcast]
+
+
+blob_policies = [
+    (None, [True, False]),
+    (const.BLOBEnable.NEVER, [True, False]),
+    (const.BLOBEnable.ALSO, [True, True]),
+    (const.BLOBEnable.ONLY, [False, True]),
+]
+
+
+@pytest.mark.parametrize("policy, expected", blob_policies)
+def test_blob_policy(policy, expected):
+    router = Router()
+
+    client = RecordingWireClient()
+    router.register_client(client)
+    if policy is not None:
+        router.process_message(
+            message.EnableBLOB(device="SOME_DEVICE", value=policy), sender=client
+        )
+
+    non_blob = message.DelProperty(device="SOME_DEVICE")
+    blob = message.SetBLOBVector(
+        device="SOME_DEVICE", name="BLOB", state=const.State.OK, children=[]
+    )
+    router.process_message(non_blob)
+    router.process_message(blob)
+
+    received = [msg for msg, _ in client.received]
+    assert [non_blob in received, blob in received] == expected
+
+
+def test_blob_policy_is_per_device():
+    router = Router()
+
+    client = RecordingWireClient()
+    router.register_client(client)
+    router.process_message(
+        message.EnableBLOB(device="SOME_DEVICE", value=const.BLOBEnable.ONLY),
+        sender=client,
+    )
+
+    late_client = RecordingWireClient()
+    router.register_client(late_client)
+
+    some = message.DelProperty(device="SOME_DEVICE")
+    other = message.DelProperty(device="OTHER_DEVICE")
+    router.process_message(some)
+    router.process_message(other)
+
+    assert [msg for msg, _ in client.received] == [other]
+    assert [msg for msg, _ in late_client.received] == [some, other]
+
+    router.unregister_client(late_client)
+    router.process_message(some)
+    assert len(late_client.received) == 2
@@ -187,3 +187,98 @@ def test_buffer_random_length_reads(input_strings, expected_output_messages):
 
     assert len(expected_output_messages) == len(output_messages)
     assert tuple(expected_output_messages) == tuple(output_messages)
+
+
+def test_buffer_large_message_in_chunks():
+    output_messages = []
+
+    buffer = Buffer()
+    buffer.max_buffer_size_before_frontal_cleanup = None
+
+    def callback(msg):
+        output_messages.append(msg)
+
+    blob_message = message.SetBLOBVector(
+        device="CAMERA",
+        name="CCD1",
+        state=const.State.OK,
+        children=[
+            one_parts.OneBLOB(
+                name="CCD1", size=1048576, format=".fits", value="A" * 1398104
+            )
+        ],
+    )
+    complete_input = (
+        raw_messages[0] + blob_message.to_string().decode("latin1") + raw_messages[1]
+    )
+
+    for pos in range(0, len(complete_input), 1024):
+        buffer.append(complete_input[pos : pos + 1024])
+        buffer.process(callback)
+
+    assert (indi_messages[0], blob_message, indi_messages[1]) == tuple(output_messages)
+
+
+def test_buffer_consumes_bytes_without_copying_rest_of_buffer():
+    output_messages = []
+
+    buffer = Buffer()
+    buffer.compaction_threshold = 256
+
+    complete_input = "".join(raw_messages * 20).encode("latin1")
+    buffer.append(complete_input)
+    buffer.process(output_messages.append)
+
+    assert tuple(indi_messages * 20) == tuple(output_messages)
+    assert buffer.data_len == 0
+    assert buffer.data == b""
+
+    buffer.append(raw_messages[0].encode("latin1") + b"<getProp")
+    buffer.process(output_messages.append)
+
+    assert output_messages[-1] == indi_messages[0]
+    assert buffer.data == b"<getProp"
+
+
+def test_buffer_reports_discarded_junk():
+    output_messages = []
+
+    buffer = Buffer()
+
+    junk = random_string(4096)
+    buffer.append(junk + raw_messages[0] + junk)
+    buffer.process(output_messages.append)
+
+    assert (indi_messages[0],) == tuple(output_messages)
+    assert buffer.discarded_bytes == 2 * len(junk)
+    assert buffer.data_len == 0
+
+
+def test_buffer_decodes_blob_while_streaming():
+    output_messages = []
+
+    buffer = Buffer()
+    buffer.max_buffer_size_before_frontal_cleanup = None
+
+    binary = bytes(randint(0, 255) for _ in range(100000))
+    blob_message = message.SetBLOBVector(
+        device="CAMERA",
+        name="CCD1",
+        state=const.State.OK,
+        children=[
+            one_parts.OneBLOB(
+                name="CCD1", size=len(binary), format=".fits", binary=binary
+            )
+        ],
+    )
+    complete_input = blob_message.to_string()
+
+    for pos in range(0, len(complete_input), 1000):
+        buffer.append(complete_input[pos : pos + 1000])
+        buffer.process(output_messages.append)
+
+    assert 1 == len(output_messages)
+    blob = output_messages[0].children[0]
+    assert isinstance(blob.binary, bytearray)
+    assert binary == blob.binary
+    assert blob_message == output_messages[0]
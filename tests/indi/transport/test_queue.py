@@ -0,0 +1,155 @@
+import asyncio
+
+from indi import message
+from indi.message import const
+from indi.transport.queue import OutboundQueue, OverflowPolicy
+
+
+def set_number(name, value, device="DEVICE"):
+    return message.SetNumberVector(
+        device=device,
+        name=name,
+        state=const.State.OK,
+        children=[message.one_parts.OneNumber(name="VALUE", value=value)],
+    )
+
+
+def set_blob(name):
+    return message.SetBLOBVector(
+        device="DEVICE", name=name, state=const.State.OK, children=[]
+    )
+
+
+def def_number(name):
+    return message.DefNumberVector(
+        device="DEVICE",
+        name=name,
+        state=const.State.OK,
+        perm=const.Permissions.READ_ONLY,
+        children=[],
+    )
+
+
+def put(queue, msg):
+    return queue.put(msg, msg.to_string())
+
+
+def drain(queue):
+    result = []
+    while True:
+        data = queue.get_nowait()
+        if data is None:
+            return result
+        result.append(data)
+
+
+def test_queue_keeps_order():
+    queue = OutboundQueue(10)
+    messages = [set_number("A", 1), set_number("B", 2), set_number("A", 3)]
+    for msg in messages:
+        assert put(queue, msg)
+
+    assert queue.depth == 3
+    assert drain(queue) == [msg.to_string() for msg in messages]
+    assert queue.depth == 0
+    assert queue.max_depth == 3
+
+
+def test_drop_oldest_keeps_blobs_and_definitions():
+    queue = OutboundQueue(3, policy=OverflowPolicy.DROP_OLDEST)
+    definition, blob = def_number("A"), set_blob("B")
+    first, second = set_number("A", 1), set_number("A", 2)
+    for msg in (definition, blob, first, second):
+        assert put(queue, msg)
+
+    assert queue.dropped == 1
+    assert drain(queue) == [m.to_string() for m in (definition, blob, second)]
+
+
+def test_coalesce_replaces_queued_update_of_the_same_vector():
+    queue = OutboundQueue(2, policy=OverflowPolicy.COALESCE)
+    first, other, second = set_number("A", 1), set_number("B", 2), set_number("A", 3)
+    for msg in (first, other, second):
+        assert put(queue, msg)
+
+    assert queue.coalesced == 1
+    assert queue.dropped == 0
+    assert drain(queue) == [m.to_string() for m in (second, other)]
+
+
+def test_coalesce_does_not_cross_definition():
+    queue = OutboundQueue(3, policy=OverflowPolicy.COALESCE)
+    first, definition, second = set_number("A", 1), def_number("A"), set_number("A", 2)
+    for msg in (first, definition, set_number("B", 1), second):
+        assert put(queue, msg)
+
+    assert queue.coalesced == 0
+    assert queue.dropped == 1
+    assert drain(queue)[0] == definition.to_string()
+
+
+def test_disconnect_policy():
+    queue = OutboundQueue(1, policy=OverflowPolicy.DISCONNECT)
+    assert put(queue, set_number("A", 1))
+    assert not put(queue, set_number("A", 2))
+    assert queue.overflowed
+    assert queue.depth == 0
+
+
+def test_drop_policy_disconnects_when_nothing_can_be_dropped():
+    queue = OutboundQueue(1, policy=OverflowPolicy.DROP_OLDEST)
+    assert put(queue, set_blob("A"))
+    assert not put(queue, set_blob("A"))
+    assert queue.overflowed
+
+
+def test_get_waits_for_message():
+    async def run():
+        queue = OutboundQueue(10)
+        getter = asyncio.ensure_future(queue.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+
+        put(queue, set_number("A", 1))
+        return await asyncio.wait_for(getter, 1)
+
+    assert asyncio.run(run()) == set_number("A", 1).to_string()
+
+
+def test_coalescing_mode_keeps_latest_value():
+    queue = OutboundQueue(10, coalesce=True)
+    for value in range(5):
+        assert put(queue, set_number("A", value))
+    other = set_number("B", 1)
+    put(queue, other)
+
+    assert queue.coalesced == 4
+    assert drain(queue) == [set_number("A", 4).to_string(), other.to_string()]
+
+
+def test_coalescing_mode_preserves_message_ordering():
+    queue = OutboundQueue(10, coalesce=True)
+    note = message.Message(device="DEVICE", message="exposure started")
+    with_text = set_number("B", 1)
+    with_text.message = "moving"
+    for msg in (set_number("A", 1), note, set_number("A", 2)):
+        put(queue, msg)
+    for msg in (with_text, set_number("B", 2)):
+        put(queue, msg)
+
+    assert queue.coalesced == 0
+    assert queue.depth == 5
+
+
+def test_get_batch_takes_all_queued_messages():
+    async def run():
+        queue = OutboundQueue(10)
+        messages = [set_number("A", 1), set_number("B", 2)]
+        for msg in messages:
+            put(queue, msg)
+        batch = await queue.get_batch(flush_window=0.001)
+        return messages, batch, queue.depth
+
+    messages, batch, depth = asyncio.run(run())
+    assert batch == [msg.to_string() for msg in messages]
+    assert depth == 0
@@ -0,0 +1,32 @@
+from indi.transport import ReadSize
+
+
+def test_fixed_read_size():
+    read_size = ReadSize(1024)
+
+    read_size.update(1024)
+    read_size.update(1024)
+
+    assert read_size.size == 1024
+
+
+def test_adaptive_read_size_grows_while_data_keeps_arriving():
+    read_size = ReadSize(1024, adaptive=True, max_size=8192)
+
+    for _ in range(10):
+        read_size.update(read_size.size)
+
+    assert read_size.size == 8192
+
+
+def test_adaptive_read_size_shrinks_on_interactive_traffic():
+    read_size = ReadSize(1024, adaptive=True, max_size=8192)
+    read_size.size = 8192
+
+    read_size.update(1500)
+    assert read_size.size == 4096
+
+    for _ in range(10):
+        read_size.update(100)
+
+    assert read_size.size == 1024
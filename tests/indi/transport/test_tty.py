@@ -0,0 +1,56 @@
+import asyncio
+import os
+
+from indi import message
+from indi.routing import Device, Router
+from indi.transport import server
+
+
+class RecordingDevice(Device):
+    def __init__(self):
+        self.received = asyncio.Queue()
+
+    def accepts(self, device):
+        return True
+
+    def message_from_client(self, msg):
+        self.received.put_nowait(msg)
+
+
+def test_tty_transport_over_pipes():
+    async def run():
+        stdin_read, stdin_write = os.pipe()
+        stdout_read, stdout_write = os.pipe()
+
+        router = Router()
+        device = RecordingDevice()
+        router.register_device(device)
+
+        tty = server.TTY(
+            router,
+            stdin=os.fdopen(stdin_read, "rb", buffering=0),
+            stdout=os.fdopen(stdout_write, "wb", buffering=0),
+        )
+        server_task = asyncio.ensure_future(tty.start())
+
+        # message split over lines and writes
+        os.write(stdin_write, b'<getProperties\nversion="1.7"\n')
+        os.write(stdin_write, b"/>\n")
+        from_client = await asyncio.wait_for(device.received.get(), 1)
+
+        router.process_message(message.DelProperty(device="DEVICE"), sender=device)
+        loop = asyncio.get_running_loop()
+        from_server = await asyncio.wait_for(
+            loop.run_in_executor(None, os.read, stdout_read, 65536), 1
+        )
+
+        os.close(stdin_write)
+        await asyncio.wait_for(server_task, 1)
+        os.close(stdout_read)
+        return from_client, from_server, router
+
+    from_client, from_server, router = asyncio.run(run())
+
+    assert from_client.to_string() == message.GetProperties(version="1.7").to_string()
+    assert from_server == message.DelProperty(device="DEVICE").to_string()
+    assert router.clients == []
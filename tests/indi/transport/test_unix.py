@@ -0,0 +1,107 @@
+import asyncio
+import os
+
+from indi import message
+from indi.message import const, one_parts
+from indi.routing import Device, Router
+from indi.transport import client, server
+
+
+class RecordingDevice(Device):
+    def __init__(self):
+        self.received = asyncio.Queue()
+
+    def accepts(self, device):
+        return True
+
+    def message_from_client(self, msg):
+        self.received.put_nowait(msg)
+
+
+def test_unix_socket_transport(tmp_path):
+    path = str(tmp_path / "indiserver")
+
+    async def run():
+        router = Router()
+        device = RecordingDevice()
+        router.register_device(device)
+
+        server_task = asyncio.ensure_future(server.UNIX(router, path=path).start())
+        for _ in range(100):
+            if os.path.exists(path):
+                break
+            await asyncio.sleep(0.01)
+
+        received: asyncio.Queue = asyncio.Queue()
+        connection = await client.UNIX(path=path).connect(received.put_nowait)
+        reader_task = asyncio.ensure_future(connection.wait_for_messages())
+
+        get_properties = message.GetProperties(version="2.0")
+        connection.send_message(get_properties)
+        from_client = await asyncio.wait_for(device.received.get(), 1)
+
+        del_property = message.DelProperty(device="DEVICE")
+        router.process_message(del_property, sender=device)
+        from_server = await asyncio.wait_for(received.get(), 1)
+
+        connection.close()
+        reader_task.cancel()
+        server_task.cancel()
+        await asyncio.gather(reader_task, server_task, return_exceptions=True)
+        return from_client, from_server
+
+    from_client, from_server = asyncio.run(run())
+
+    assert from_client.to_string() == message.GetProperties(version="2.0").to_string()
+    assert from_server.to_string() == message.DelProperty(device="DEVICE").to_string()
+    assert not os.path.exists(path)
+
+
+def test_unix_socket_shared_memory_blobs(tmp_path):
+    path = str(tmp_path / "indiserver")
+    binary = os.urandom(100000)
+
+    async def run():
+        router = Router()
+        server_task = asyncio.ensure_future(server.UNIX(router, path=path).start())
+        for _ in range(100):
+            if os.path.exists(path):
+                break
+            await asyncio.sleep(0.01)
+
+        received: asyncio.Queue = asyncio.Queue()
+        connection = await client.UNIX(path=path, shared_memory=True).connect(
+            received.put_nowait, for_blobs=True
+        )
+        reader_task = asyncio.ensure_future(connection.wait_for_messages())
+        connection.send_message(
+            message.EnableBLOB(device="CAMERA", value=const.BLOBEnable.ALSO, shm="1")
+        )
+        while not router.clients or not router.blob_routing[router.clients[0]]:
+            await asyncio.sleep(0.01)
+
+        router.process_message(
+            message.SetBLOBVector(
+                device="CAMERA",
+                name="CCD1",
+                state=const.State.OK,
+                children=[
+                    one_parts.OneBLOB(
+                        name="CCD1", size=len(binary), format=".fits", binary=binary
+                    )
+                ],
+            )
+        )
+        blob = await asyncio.wait_for(received.get(), 1)
+
+        connection.close()
+        reader_task.cancel()
+        server_task.cancel()
+        await asyncio.gather(reader_task, server_task, return_exceptions=True)
+        return blob
+
+    blob = asyncio.run(run())
+
+    part = blob.children[0]
+    assert part.shm is not None
+    assert part.binary == binary